@@ -13,15 +13,87 @@ Features:
 """
 
 import subprocess
+import array
+import csv
 import json
+import os
+import sys
 import time
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, NamedTuple, TYPE_CHECKING
 from dataclasses import dataclass
 from datetime import datetime
-import matplotlib.pyplot as plt
-import numpy as np
+from string import Template
+
+# numpy (and numba, when installed) are imported on first analysis so that
+# scheduling-only callers do not pay their import cost
+if TYPE_CHECKING:
+    import numpy as np
+
+# Read size for k6 NDJSON result files (multi-GB for long runs)
+_RESULTS_READ_BUFFER = 4 * 1024 * 1024
+
+# k6 script templates, parsed once at import time
+_SCENARIO_TMPL = Template("""
+    "$name": {
+        executor: "constant-arrival-rate",
+        rate: $rate,
+        timeUnit: "1s",
+        duration: "$duration",
+        preAllocatedVUs: $vus,
+        maxVUs: $max_vus,
+        gracefulStop: "30s",
+        startTime: "$start_time",
+        exec: "$func_name"
+    }""")
+
+_FUNCTION_TMPL = Template("""
+export function $func_name() {
+    const payload = {
+        content_type: "$content_type",
+        prompt: "Test image generation $complexity",
+        dimensions: [$width, $height],
+        format: "PNG",
+        quality: "HIGH",
+        batch_size: $batch_size
+    };
+    
+    const res = http.post("http://localhost:8000/generate", JSON.stringify(payload), {
+        headers: { "Content-Type": "application/json" }
+    });
+    
+    check(res, {
+        "status is 200": (r) => r.status === 200,
+        "response time < 30s": (r) => r.timings.duration < 30000
+    });
+}""")
+
+_K6_SCRIPT_TMPL = Template("""
+import http from "k6/http";
+import { check } from "k6";
+
+export const options = {
+    scenarios: {$scenarios_js
+    },
+    thresholds: {
+        http_req_duration: ["p(95)<30000"],  // 95% of requests should be below 30s
+        http_req_failed: ["rate<0.01"],     // Error rate should be less than 1%
+    }
+};
+
+$functions_js
+
+export function setup() {
+    console.log("🚀 Starting load test with $scenario_count scenarios");
+    return { test_start_time: Date.now() };
+}
+
+export function teardown(data) {
+    console.log("🏁 Load test completed");
+}
+""")
 
 @dataclass
 class LoadTestConfig:
@@ -29,17 +101,123 @@ class LoadTestConfig:
     duration: str = "2m"  # Test duration
     virtual_users: int = 10  # Number of virtual users
     ramp_up_time: str = "30s"  # Ramp-up period
+    arrival_rate: Optional[int] = None  # Iterations/sec per scenario (default: virtual_users // 2)
     test_scenarios: List[Dict[str, Any]] = None
-    output_format: str = "json"  # json, csv, influxdb
+    output_format: str = "csv"  # json, csv, influxdb
 
-@dataclass
-class TestScenario:
-    """Individual test scenario"""
+class TestScenario(NamedTuple):
+    """Individual test scenario (immutable, tuple-backed)"""
     name: str
     resolution: tuple  # (width, height)
     content_type: str  # "image" or "video"
     batch_size: int = 1
     complexity: str = "basic"  # basic, medium, complex
+    start_time: str = "0s"  # k6 startTime offset within the run
+
+@lru_cache(maxsize=None)
+def _k6_func_name(scenario_name: str) -> str:
+    """k6 exec function name for a scenario (memoized across script builds)"""
+    return f"generate{scenario_name.replace('_', '')}"
+
+def _iter_ndjson(path: Path):
+    """Yield parsed records from an NDJSON file using large sequential reads"""
+    with open(path, 'rb', buffering=_RESULTS_READ_BUFFER) as f:
+        if hasattr(os, 'posix_fadvise'):
+            # Let the kernel read ahead aggressively for this sequential scan
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def _reduce_response_times_numpy(durations, statuses):
+    """Mean/min/max of response times and 2xx count via NumPy reductions"""
+    import numpy as np
+    successful = int(np.count_nonzero((statuses >= 200) & (statuses < 300)))
+    return (float(durations.mean(dtype=np.float64)), float(durations.min()),
+            float(durations.max()), successful)
+
+def _reduce_response_times_loop(durations, statuses):
+    """Mean/min/max of response times and 2xx count in one fused loop (Numba kernel body)"""
+    total = 0.0
+    lowest = durations[0]
+    highest = durations[0]
+    for i in range(durations.size):
+        value = durations[i]
+        total += value
+        lowest = min(lowest, value)
+        highest = max(highest, value)
+    successful = 0
+    for i in range(statuses.size):
+        status = statuses[i]
+        if status >= 200 and status < 300:
+            successful += 1
+    return total / durations.size, lowest, highest, successful
+
+@lru_cache(maxsize=None)
+def _get_response_time_reducer():
+    """JIT-compiled reducer when numba is installed, otherwise the NumPy one"""
+    try:
+        from numba import njit
+    except ImportError:
+        return _reduce_response_times_numpy
+    return njit(cache=True, fastmath=True)(_reduce_response_times_loop)
+
+def _sample_columns(durations: array.array, statuses: array.array,
+                    scenario_tags: List[str]) -> Dict[str, 'np.ndarray']:
+    """Wrap accumulated sample buffers as NumPy columns (zero-copy for numerics)"""
+    import numpy as np
+    return {
+        'durations': np.frombuffer(durations, dtype=np.float32),
+        'statuses': np.frombuffer(statuses, dtype=np.intc),
+        'scenarios': np.array(scenario_tags, dtype=str)
+    }
+
+# Fixed 2x2 chart layout rendered directly with Pillow
+_CHART_SIZE = (1500, 1000)
+_CHART_TITLE_HEIGHT = 50
+
+def _draw_centered_text(draw, x: float, y: float, text: str, fill: str = 'black'):
+    """Draw text horizontally centered on x with its top edge at y"""
+    left, top, right, bottom = draw.textbbox((0, 0), text)
+    draw.text((x - (right - left) / 2, y), text, fill=fill)
+
+def _draw_bar_panel(draw, box: tuple, title: str, labels: List[str],
+                    values: List[float], colors: List[str], value_format: str = '{:.0f}'):
+    """Draw a titled bar chart with value labels inside box"""
+    left, top, right, bottom = box
+    _draw_centered_text(draw, (left + right) / 2, top + 10, title)
+    plot_left, plot_top, plot_right, plot_bottom = left + 40, top + 50, right - 20, bottom - 40
+    draw.line([(plot_left, plot_top), (plot_left, plot_bottom), (plot_right, plot_bottom)], fill='black')
+    
+    peak = max(values, default=0) or 1
+    slot = (plot_right - plot_left) / max(len(values), 1)
+    for i, (label, value, color) in enumerate(zip(labels, values, colors)):
+        x0 = plot_left + i * slot + slot * 0.15
+        x1 = plot_left + (i + 1) * slot - slot * 0.15
+        y0 = plot_bottom - (plot_bottom - plot_top) * (value / peak)
+        draw.rectangle([x0, y0, x1, plot_bottom], fill=color)
+        _draw_centered_text(draw, (x0 + x1) / 2, y0 - 15, value_format.format(value))
+        _draw_centered_text(draw, (x0 + x1) / 2, plot_bottom + 8, str(label))
+
+def _draw_pie_panel(draw, box: tuple, title: str, labels: List[str],
+                    fractions: List[float], colors: List[str]):
+    """Draw a titled pie chart with a percentage legend inside box"""
+    left, top, right, bottom = box
+    _draw_centered_text(draw, (left + right) / 2, top + 10, title)
+    radius = min(right - left, bottom - top - 60) / 2 - 20
+    cx, cy = (left + right) / 2 - 60, (top + 50 + bottom) / 2
+    
+    start = -90.0
+    total = sum(fractions) or 1
+    for i, (label, fraction, color) in enumerate(zip(labels, fractions, colors)):
+        sweep = 360.0 * fraction / total
+        if sweep > 0:
+            draw.pieslice([cx - radius, cy - radius, cx + radius, cy + radius],
+                          start, start + sweep, fill=color)
+        start += sweep
+        legend_y = top + 70 + i * 25
+        draw.rectangle([right - 150, legend_y, right - 135, legend_y + 15], fill=color)
+        draw.text((right - 128, legend_y), f"{label}: {fraction / total * 100:.1f}%", fill='black')
 
 class K6LoadTester:
     """
@@ -84,121 +262,109 @@ class K6LoadTester:
                           config: LoadTestConfig) -> str:
         """Generate k6 JavaScript test script"""
         
-        # Convert scenarios to JS format
-        js_scenarios = []
-        for scenario in scenarios:
-            js_scenarios.append(f"""
-    "{scenario.name}": {{
-        executor: "constant-vus",
-        vus: {config.virtual_users},
-        duration: "{config.duration}",
-        gracefulStop: "30s",
-        exec: "generate{scenario.name.replace('_', '')}"
-    }}""")
+        # Only the small per-scenario fragments are built in the loop;
+        # the static JS skeleton lives in the module-level templates
+        # Requests are paced by k6's arrival-rate scheduler rather than a JS
+        # sleep; the default matches the old ~2s think time per VU
+        rate = config.arrival_rate or max(1, config.virtual_users // 2)
         
-        scenarios_js = ",".join(js_scenarios)
-        
-        # Generate function definitions for each scenario
+        js_scenarios = []
         functions_js = []
         for scenario in scenarios:
-            func_name = f"generate{scenario.name.replace('_', '')}"
-            functions_js.append(f"""
-export function {func_name}() {{
-    const payload = {{
-        content_type: "{scenario.content_type}",
-        prompt: "Test image generation {scenario.complexity}",
-        dimensions: [{scenario.resolution[0]}, {scenario.resolution[1]}],
-        format: "PNG",
-        quality: "HIGH",
-        batch_size: {scenario.batch_size}
-    }};
-    
-    const res = http.post("http://localhost:8000/generate", JSON.stringify(payload), {{
-        headers: {{ "Content-Type": "application/json" }}
-    }});
-    
-    check(res, {{
-        "status is 200": (r) => r.status === 200,
-        "response time < 30s": (r) => r.timings.duration < 30000
-    }});
-    
-    // Add some delay between requests
-    sleep(Math.random() * 2 + 1);
-}}""")
-        
-        functions_js_str = "\n".join(functions_js)
-        
-        # Complete k6 script
-        k6_script = f"""
-import http from "k6/http";
-import {{ check, sleep }} from "k6";
-
-export const options = {{
-    scenarios: {{{scenarios_js}
-    }},
-    thresholds: {{
-        http_req_duration: ["p(95)<30000"],  // 95% of requests should be below 30s
-        http_req_failed: ["rate<0.01"],     // Error rate should be less than 1%
-    }}
-}};
-
-{functions_js_str}
-
-export function setup() {{
-    console.log("🚀 Starting load test with {len(scenarios)} scenarios");
-    return {{ test_start_time: Date.now() }};
-}}
-
-export function teardown(data) {{
-    console.log("🏁 Load test completed");
-}}
-"""
-        return k6_script
+            func_name = _k6_func_name(scenario.name)
+            js_scenarios.append(_SCENARIO_TMPL.substitute(
+                name=scenario.name,
+                rate=rate,
+                vus=config.virtual_users,
+                max_vus=config.virtual_users * 2,
+                duration=config.duration,
+                start_time=scenario.start_time,
+                func_name=func_name
+            ))
+            functions_js.append(_FUNCTION_TMPL.substitute(
+                func_name=func_name,
+                content_type=scenario.content_type,
+                complexity=scenario.complexity,
+                width=scenario.resolution[0],
+                height=scenario.resolution[1],
+                batch_size=scenario.batch_size
+            ))
+        
+        return _K6_SCRIPT_TMPL.substitute(
+            scenarios_js=",".join(js_scenarios),
+            functions_js="\n".join(functions_js),
+            scenario_count=len(scenarios)
+        )
     
     def run_load_test(self, scenarios: List[TestScenario] = None, 
-                     config: LoadTestConfig = None) -> Dict[str, Any]:
-        """Run load test using k6"""
+                     config: LoadTestConfig = None,
+                     scenario_groups: Optional[Dict[str, Set[str]]] = None) -> Dict[str, Any]:
+        """Run load test using k6
+        
+        scenario_groups optionally maps a group name to scenario names; the
+        result then carries per-group metrics under 'group_metrics'.
+        """
         scenarios = scenarios or self.default_scenarios
         config = config or LoadTestConfig()
         
+        # One timestamp names every artifact of this run
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
         # Generate test script
         test_script = self.generate_k6_script(scenarios, config)
-        script_path = self.results_dir / f"load_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.js"
+        script_path = self.results_dir / f"load_test_{timestamp}.js"
         
         with open(script_path, 'w') as f:
             f.write(test_script)
         
         self.logger.info(f"📝 Generated k6 script: {script_path}")
         
-        # Prepare k6 command
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        results_path = self.results_dir / f"results_{timestamp}.json"
+        # Prepare k6 command; CSV output is a fixed, numeric-friendly schema
+        # that is far smaller and cheaper to ingest than per-sample JSON
+        output_format = "json" if config.output_format == "json" else "csv"
+        results_path = self.results_dir / f"results_{timestamp}.{output_format}"
         
         cmd = [
             self.k6_path,
             "run",
             str(script_path),
-            "--out", f"json={results_path}",
+            "--out", f"{output_format}={results_path}",
             "--summary-export", str(self.results_dir / f"summary_{timestamp}.json")
         ]
         
         self.logger.info("🏃 Running load test...")
-        self.logger.info(f"Command: {' '.join(cmd)}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Command: {' '.join(cmd)}")
+        
+        # k6 streams progress to stderr for the whole run; send it to a log
+        # file instead of buffering it in memory (results come via --out csv/json)
+        log_path = self.results_dir / f"k6_{timestamp}.log"
+        start_time = time.perf_counter()
         
         try:
-            # Run k6 test
-            start_time = time.time()
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
-            execution_time = time.time() - start_time
+            # Run k6 test, streaming its stderr to the log file instead of buffering it
+            # (no preexec_fn, so CPython 3.10+ on Linux can spawn it with vfork rather than fork)
+            with open(log_path, 'wb') as log_file:
+                proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=log_file)
+                try:
+                    returncode = proc.wait(timeout=3600)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+                    raise
+            execution_time = time.perf_counter() - start_time
             
-            if result.returncode == 0:
+            if returncode == 0:
                 self.logger.info("✅ Load test completed successfully")
-                return self._process_test_results(results_path, execution_time, scenarios)
+                return self._process_test_results(results_path, execution_time, scenarios,
+                                                  scenario_groups, timestamp)
             else:
-                self.logger.error(f"❌ Load test failed: {result.stderr}")
+                error_output = self._read_log_tail(log_path)
+                self.logger.error(f"❌ Load test failed: {error_output}")
                 return {
                     'success': False,
-                    'error': result.stderr,
+                    'error': error_output,
+                    'log_path': str(log_path),
                     'execution_time': execution_time
                 }
                 
@@ -214,28 +380,43 @@ export function teardown(data) {{
             return {
                 'success': False,
                 'error': str(e),
-                'execution_time': time.time() - start_time
+                'execution_time': time.perf_counter() - start_time
             }
     
+    def _read_log_tail(self, log_path: Path, max_bytes: int = 4096) -> str:
+        """Read the last few KB of a k6 log file for error reporting"""
+        try:
+            with open(log_path, 'rb') as f:
+                f.seek(0, 2)
+                size = f.tell()
+                f.seek(max(0, size - max_bytes))
+                return f.read().decode('utf-8', errors='replace')
+        except OSError as e:
+            return str(e)
+    
     def _process_test_results(self, results_path: Path, 
                             execution_time: float, 
-                            scenarios: List[TestScenario]) -> Dict[str, Any]:
+                            scenarios: List[TestScenario],
+                            scenario_groups: Optional[Dict[str, Set[str]]] = None,
+                            timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Process and analyze test results"""
         try:
-            # Read raw results
-            with open(results_path, 'r') as f:
-                raw_results = [json.loads(line) for line in f if line.strip()]
+            # Read raw results once into columnar samples
+            if results_path.suffix == '.csv':
+                samples = self._collect_samples_csv(results_path)
+            else:
+                samples = self._collect_samples(_iter_ndjson(results_path))
             
             # Extract metrics
-            metrics = self._extract_metrics(raw_results)
+            metrics = self._extract_metrics(samples)
             
             # Generate comparative analysis
             analysis = self._analyze_performance(metrics, scenarios)
             
             # Create visualization
-            self._create_performance_charts(metrics, scenarios)
+            self._create_performance_charts(metrics, scenarios, timestamp)
             
-            return {
+            result = {
                 'success': True,
                 'execution_time': execution_time,
                 'raw_results_path': str(results_path),
@@ -244,6 +425,14 @@ export function teardown(data) {{
                 'timestamp': datetime.now().isoformat()
             }
             
+            if scenario_groups:
+                result['group_metrics'] = {
+                    group: self._extract_metrics(samples, names)
+                    for group, names in scenario_groups.items()
+                }
+            
+            return result
+            
         except Exception as e:
             self.logger.error(f"❌ Failed to process results: {e}")
             return {
@@ -252,28 +441,76 @@ export function teardown(data) {{
                 'execution_time': execution_time
             }
     
-    def _extract_metrics(self, raw_results: List[Dict]) -> Dict[str, Any]:
-        """Extract performance metrics from raw results"""
-        http_metrics = [r for r in raw_results if r.get('type') == 'HTTP']
-        
-        if not http_metrics:
+    def _collect_samples(self, raw_results) -> Dict[str, 'np.ndarray']:
+        """Collect k6 http_req_duration points into columnar arrays"""
+        # Single pass over the k6 sample points into contiguous buffers;
+        # float32 is ample for millisecond response times and halves the
+        # memory traffic of the percentile/mean reductions
+        durations = array.array('f')
+        statuses = array.array('i')
+        scenario_tags = []
+        for record in raw_results:
+            if record.get('type') != 'Point' or record.get('metric') != 'http_req_duration':
+                continue
+            data = record.get('data', {})
+            tags = data.get('tags', {})
+            durations.append(data.get('value', 0))
+            statuses.append(int(tags.get('status') or 0))
+            scenario_tags.append(tags.get('scenario', ''))
+        
+        return _sample_columns(durations, statuses, scenario_tags)
+    
+    def _collect_samples_csv(self, results_path: Path) -> Dict[str, 'np.ndarray']:
+        """Collect http_req_duration rows from k6 CSV output into columnar arrays"""
+        durations = array.array('f')
+        statuses = array.array('i')
+        scenario_tags = []
+        with open(results_path, newline='', buffering=_RESULTS_READ_BUFFER) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header:
+                name_col = header.index('metric_name')
+                value_col = header.index('metric_value')
+                status_col = header.index('status')
+                scenario_col = header.index('scenario')
+                for row in reader:
+                    if row[name_col] != 'http_req_duration':
+                        continue
+                    durations.append(float(row[value_col]))
+                    statuses.append(int(row[status_col] or 0))
+                    scenario_tags.append(row[scenario_col])
+        
+        return _sample_columns(durations, statuses, scenario_tags)
+    
+    def _extract_metrics(self, samples: Dict[str, 'np.ndarray'],
+                         scenario_names: Optional[Set[str]] = None) -> Dict[str, Any]:
+        """Extract performance metrics from collected samples, optionally for a subset of scenarios"""
+        import numpy as np
+        response_times = samples['durations']
+        status_codes = samples['statuses']
+        if scenario_names is not None:
+            in_group = np.isin(samples['scenarios'], list(scenario_names))
+            response_times = response_times[in_group]
+            status_codes = status_codes[in_group]
+        
+        if not response_times.size:
             return {'error': 'No HTTP metrics found'}
         
-        # Calculate response times
-        response_times = [m['value'] for m in http_metrics if m.get('metric') == 'http_req_duration']
-        status_codes = [m['value'] for m in http_metrics if m.get('metric') == 'http_req_status']
+        total_requests = int(response_times.size)
+        avg_time, min_time, max_time, successful = _get_response_time_reducer()(response_times, status_codes)
+        median_time, p95_time, p99_time = np.percentile(response_times, [50, 95, 99])
         
         return {
-            'total_requests': len(http_metrics),
-            'successful_requests': len([s for s in status_codes if str(s).startswith('2')]),
-            'error_rate': 1 - (len([s for s in status_codes if str(s).startswith('2')]) / len(status_codes)) if status_codes else 1,
-            'avg_response_time': np.mean(response_times) if response_times else 0,
-            'median_response_time': np.median(response_times) if response_times else 0,
-            'p95_response_time': np.percentile(response_times, 95) if response_times else 0,
-            'p99_response_time': np.percentile(response_times, 99) if response_times else 0,
-            'min_response_time': min(response_times) if response_times else 0,
-            'max_response_time': max(response_times) if response_times else 0,
-            'requests_per_second': len(http_metrics) / (max(response_times) / 1000) if response_times else 0
+            'total_requests': total_requests,
+            'successful_requests': int(successful),
+            'error_rate': 1 - (successful / total_requests),
+            'avg_response_time': float(avg_time),
+            'median_response_time': float(median_time),
+            'p95_response_time': float(p95_time),
+            'p99_response_time': float(p99_time),
+            'min_response_time': float(min_time),
+            'max_response_time': float(max_time),
+            'requests_per_second': total_requests / (max_time / 1000) if max_time else 0
         }
     
     def _analyze_performance(self, metrics: Dict[str, Any], 
@@ -313,11 +550,23 @@ export function teardown(data) {{
         return analysis
     
     def _create_performance_charts(self, metrics: Dict[str, Any], 
-                                 scenarios: List[TestScenario]):
-        """Create performance visualization charts"""
+                                 scenarios: List[TestScenario],
+                                 timestamp: Optional[str] = None):
+        """Create performance visualization charts, named with the run's timestamp"""
         try:
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
-            fig.suptitle('Load Test Performance Analysis', fontsize=16)
+            from PIL import Image, ImageDraw
+            
+            width, height = _CHART_SIZE
+            image = Image.new('RGB', _CHART_SIZE, 'white')
+            draw = ImageDraw.Draw(image)
+            _draw_centered_text(draw, width / 2, 15, 'Load Test Performance Analysis')
+            
+            half_w, half_h = width // 2, (height - _CHART_TITLE_HEIGHT) // 2
+            panels = [
+                (col * half_w, _CHART_TITLE_HEIGHT + row * half_h,
+                 (col + 1) * half_w, _CHART_TITLE_HEIGHT + (row + 1) * half_h)
+                for row in range(2) for col in range(2)
+            ]
             
             # Response time distribution
             response_times = [
@@ -327,34 +576,20 @@ export function teardown(data) {{
                 metrics.get('p95_response_time', 0),
                 metrics.get('max_response_time', 0)
             ]
-            
-            percentiles = ['Min', 'Avg', 'Median', '95th', 'Max']
-            bars = ax1.bar(range(len(percentiles)), response_times, color=['blue', 'green', 'orange', 'red', 'purple'])
-            ax1.set_title('Response Time Percentiles (ms)')
-            ax1.set_xlabel('Percentile')
-            ax1.set_ylabel('Response Time (ms)')
-            ax1.set_xticks(range(len(percentiles)))
-            ax1.set_xticklabels(percentiles)
-            
-            # Add value labels on bars
-            for bar, value in zip(bars, response_times):
-                ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 100,
-                        f'{value:.0f}', ha='center', va='bottom')
+            _draw_bar_panel(draw, panels[0], 'Response Time Percentiles (ms)',
+                            ['Min', 'Avg', 'Median', '95th', 'Max'], response_times,
+                            ['blue', 'green', 'orange', 'red', 'purple'])
             
             # Error rate
             error_rate = metrics.get('error_rate', 0)
             success_rate = 1 - error_rate
-            
-            ax2.pie([success_rate, error_rate], labels=['Success', 'Error'], 
-                   autopct='%1.1f%%', colors=['green', 'red'])
-            ax2.set_title('Request Success Rate')
+            _draw_pie_panel(draw, panels[1], 'Request Success Rate',
+                            ['Success', 'Error'], [success_rate, error_rate], ['green', 'red'])
             
             # Throughput
             rps = metrics.get('requests_per_second', 0)
-            ax3.bar(['Requests/sec'], [rps], color='blue')
-            ax3.set_title('Throughput')
-            ax3.set_ylabel('Requests per Second')
-            ax3.text(0, rps + 0.1, f'{rps:.2f}', ha='center', va='bottom')
+            _draw_bar_panel(draw, panels[2], 'Throughput (requests per second)',
+                            ['Requests/sec'], [rps], ['blue'], value_format='{:.2f}')
             
             # Scenario distribution (simplified)
             scenario_counts = {}
@@ -362,17 +597,14 @@ export function teardown(data) {{
                 res_key = f"{scenario.resolution[0]}x{scenario.resolution[1]}"
                 scenario_counts[res_key] = scenario_counts.get(res_key, 0) + 1
             
-            ax4.bar(scenario_counts.keys(), scenario_counts.values(), color='orange')
-            ax4.set_title('Test Scenarios by Resolution')
-            ax4.set_ylabel('Number of Scenarios')
-            ax4.tick_params(axis='x', rotation=45)
-            
-            plt.tight_layout()
+            _draw_bar_panel(draw, panels[3], 'Test Scenarios by Resolution',
+                            list(scenario_counts.keys()), list(scenario_counts.values()),
+                            ['orange'] * len(scenario_counts))
             
             # Save chart
-            chart_path = self.results_dir / f"performance_chart_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-            plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-            plt.close()
+            timestamp = timestamp or datetime.now().strftime('%Y%m%d_%H%M%S')
+            chart_path = self.results_dir / f"performance_chart_{timestamp}.png"
+            image.save(chart_path)
             
             self.logger.info(f"📊 Performance chart saved: {chart_path}")
             
@@ -380,30 +612,44 @@ export function teardown(data) {{
             self.logger.error(f"❌ Failed to create charts: {e}")
     
     def run_comparative_test(self, resolution_sets: List[List[tuple]]) -> Dict[str, Any]:
-        """Run comparative tests across different resolution sets"""
-        comparative_results = {}
+        """Run comparative tests across different resolution sets
+        
+        All sets run in a single k6 process, staggered with startTime so they
+        do not overlap; metrics are split per set by the k6 scenario tag.
+        """
+        set_duration = 60  # seconds each set runs
+        set_spacing = set_duration + 30 + 10  # gracefulStop plus a brief pause
         
+        scenarios = []
+        scenario_groups = {}
         for i, resolutions in enumerate(resolution_sets):
-            self.logger.info(f"🔄 Running test set {i+1}/{len(resolution_sets)}")
-            
-            # Create scenarios for this resolution set
-            scenarios = []
-            for j, resolution in enumerate(resolutions):
-                scenarios.append(TestScenario(
-                    f"set{i}_res{j}", resolution, "image", 1, "basic"
-                ))
-            
-            # Run test
-            config = LoadTestConfig(duration="1m", virtual_users=5)
-            result = self.run_load_test(scenarios, config)
+            start_time = f"{i * set_spacing}s"
+            set_scenarios = [
+                TestScenario(f"set{i}_res{j}", resolution, "image", 1, "basic", start_time)
+                for j, resolution in enumerate(resolutions)
+            ]
+            scenarios.extend(set_scenarios)
+            scenario_groups[f"set_{i}"] = {scenario.name for scenario in set_scenarios}
+        
+        self.logger.info(f"🔄 Running {len(resolution_sets)} test sets in one k6 run")
+        
+        # Run test
+        config = LoadTestConfig(duration=f"{set_duration}s", virtual_users=5)
+        result = self.run_load_test(scenarios, config, scenario_groups)
+        
+        comparative_results = {}
+        for i, resolutions in enumerate(resolution_sets):
+            set_name = f"set_{i}"
+            if result.get('success'):
+                metrics = result['group_metrics'][set_name]
+                set_result = {'success': 'error' not in metrics, 'metrics': metrics}
+            else:
+                set_result = result
             
-            comparative_results[f"set_{i}"] = {
+            comparative_results[set_name] = {
                 'resolutions': resolutions,
-                'result': result
+                'result': set_result
             }
-            
-            # Brief pause between tests
-            time.sleep(10)
         
         # Generate comparative report
         report = self._generate_comparative_report(comparative_results)
@@ -457,8 +703,7 @@ export function teardown(data) {{
 # Example usage and test runner
 def main():
     """Demo load testing functionality"""
-    print("🏋️ LOAD TESTING FRAMEWORK DEMO")
-    print("=" * 35)
+    sys.stdout.write("🏋️ LOAD TESTING FRAMEWORK DEMO\n" + "=" * 35 + "\n")
     
     # Initialize tester
     tester = K6LoadTester()
@@ -467,14 +712,14 @@ def main():
         # Check if k6 is available
         try:
             subprocess.run(["k6", "version"], capture_output=True, check=True)
-            print("✅ k6 found, proceeding with load test")
+            sys.stdout.write("✅ k6 found, proceeding with load test\n")
         except (subprocess.CalledProcessError, FileNotFoundError):
-            print("⚠️  k6 not found. Please install k6 from https://k6.io/")
-            print("Running in simulation mode...")
+            sys.stdout.write("⚠️  k6 not found. Please install k6 from https://k6.io/\n"
+                             "Running in simulation mode...\n")
             return simulate_load_test()
         
         # Run basic load test
-        print("🏃 Running basic load test...")
+        sys.stdout.write("🏃 Running basic load test...\n")
         basic_scenarios = [
             TestScenario("small_image", (256, 256), "image", 1, "basic"),
             TestScenario("medium_image", (512, 512), "image", 1, "basic")
@@ -484,38 +729,41 @@ def main():
         result = tester.run_load_test(basic_scenarios, config)
         
         if result['success']:
-            print("✅ Load test completed successfully!")
-            print(f"📊 Results:")
             metrics = result['metrics']
-            print(f"   Total Requests: {metrics.get('total_requests', 0)}")
-            print(f"   Success Rate: {(1-result.get('error_rate', 1))*100:.1f}%")
-            print(f"   Avg Response Time: {metrics.get('avg_response_time', 0):.0f}ms")
-            print(f"   95th Percentile: {metrics.get('p95_response_time', 0):.0f}ms")
+            sys.stdout.write(
+                "✅ Load test completed successfully!\n"
+                "📊 Results:\n"
+                f"   Total Requests: {metrics.get('total_requests', 0)}\n"
+                f"   Success Rate: {(1-metrics.get('error_rate', 1))*100:.1f}%\n"
+                f"   Avg Response Time: {metrics.get('avg_response_time', 0):.0f}ms\n"
+                f"   95th Percentile: {metrics.get('p95_response_time', 0):.0f}ms\n"
+            )
             
             # Run comparative test
-            print("\n🔄 Running comparative test...")
+            sys.stdout.write("\n🔄 Running comparative test...\n")
             resolution_sets = [
                 [(256, 256), (512, 512)],  # Basic resolutions
                 [(1024, 1024), (512, 512)]  # Higher resolutions
             ]
             
             comparative_result = tester.run_comparative_test(resolution_sets)
-            print("📊 Comparative Analysis:")
-            for set_name, set_data in comparative_result['test_sets'].items():
-                print(f"   {set_name}: {set_data['avg_response_time']:.0f}ms avg")
+            lines = ["📊 Comparative Analysis:"]
+            lines.extend(f"   {set_name}: {set_data['avg_response_time']:.0f}ms avg"
+                         for set_name, set_data in comparative_result['test_sets'].items())
+            sys.stdout.write("\n".join(lines) + "\n")
             
         else:
-            print(f"❌ Load test failed: {result.get('error', 'Unknown error')}")
+            sys.stdout.write(f"❌ Load test failed: {result.get('error', 'Unknown error')}\n")
             
     except Exception as e:
-        print(f"❌ Error: {e}")
+        sys.stdout.write(f"❌ Error: {e}\n")
         return False
     
     return True
 
 def simulate_load_test():
     """Simulate load test when k6 is not available"""
-    print("🎭 Simulating load test results...")
+    sys.stdout.write("🎭 Simulating load test results...\n")
     
     # Simulated results
     simulated_metrics = {
@@ -531,11 +779,13 @@ def simulate_load_test():
         'requests_per_second': 2.5
     }
     
-    print("📊 Simulated Results:")
-    print(f"   Total Requests: {simulated_metrics['total_requests']}")
-    print(f"   Success Rate: {(1-simulated_metrics['error_rate'])*100:.1f}%")
-    print(f"   Avg Response Time: {simulated_metrics['avg_response_time']:.0f}ms")
-    print(f"   95th Percentile: {simulated_metrics['p95_response_time']:.0f}ms")
+    sys.stdout.write(
+        "📊 Simulated Results:\n"
+        f"   Total Requests: {simulated_metrics['total_requests']}\n"
+        f"   Success Rate: {(1-simulated_metrics['error_rate'])*100:.1f}%\n"
+        f"   Avg Response Time: {simulated_metrics['avg_response_time']:.0f}ms\n"
+        f"   95th Percentile: {simulated_metrics['p95_response_time']:.0f}ms\n"
+    )
     
     return True
 
@@ -10,37 +10,379 @@ test result analysis and system metrics visualization.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Callable
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Callable, Tuple, Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
 from datetime import datetime
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import hashlib
 import json
+import math
+import os
+import re
 import yaml
 import subprocess
+import sys
 import time
 import uuid
-from elasticsearch import Elasticsearch
+from elasticsearch import Elasticsearch, AsyncElasticsearch
+from elasticsearch.helpers import parallel_bulk, async_streaming_bulk
 import requests
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+    _encode_source = partial(orjson.dumps, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    _json_dumps = lambda obj: json.dumps(obj).encode("utf-8")
+    _encode_source = lambda obj: json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+try:
+    import xxhash
+    _content_id = xxhash.xxh3_128_hexdigest
+except ImportError:
+    xxhash = None
+    _content_id = lambda data: hashlib.blake2b(data, digest_size=16).hexdigest()
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    class LogRecord(msgspec.Struct, gc=False):
+        """Structured log line decoded straight into slots, skipping unused keys"""
+        timestamp: Any = msgspec.UNSET
+        level: Any = "INFO"
+        message: Any = msgspec.UNSET
+        component: Any = "unknown"
+        thread: Any = "main"
+        fields: Any = None
+        
+        def enrich(self, log_entry: str, timestamp: str) -> Dict[str, Any]:
+            """Enriched log entry read straight from the fixed struct slots"""
+            enriched_log = {
+                "@timestamp": timestamp if self.timestamp is msgspec.UNSET else self.timestamp,
+                "log_level": self.level,
+                "message": log_entry if self.message is msgspec.UNSET else self.message,
+                "component": self.component,
+                "thread": self.thread,
+                "tags": ["application-log"]
+            }
+            if isinstance(self.fields, dict):
+                enriched_log.update(self.fields)
+            return enriched_log
+            
+    _decode_log_line = msgspec.json.Decoder(LogRecord).decode
+    _LOG_DECODE_ERRORS = (json.JSONDecodeError, msgspec.DecodeError)
+else:
+    _decode_log_line = _json_loads
+    _LOG_DECODE_ERRORS = (json.JSONDecodeError,)
+
+# Log parsing patterns, compiled once for every processed record
+_TIMESTAMP_RE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}')
+_LEVEL_RE = re.compile(r'(INFO|ERROR|WARN|DEBUG)')
+_FAILURE_RE = re.compile(r'(timeout|timed out|connection|network|assertion|expected|memory|oom)', re.I)
+
+_FAILURE_CATEGORIES = {
+    "timeout": "timeout",
+    "timed out": "timeout",
+    "connection": "connectivity",
+    "network": "connectivity",
+    "assertion": "assertion",
+    "expected": "assertion",
+    "memory": "memory",
+    "oom": "memory"
+}
+
+# Category precedence when a message matches several keywords
+_FAILURE_PRIORITY = ("timeout", "connectivity", "assertion", "memory")
+
+# Bulk requests flush at whichever chunk limit is reached first
+_DEFAULT_CHUNK_SIZE = 500
+_DEFAULT_MAX_CHUNK_BYTES = 10 * 1024 * 1024
+_BULK_OPTIONS = {
+    "raise_on_error": False,
+    "refresh": "false"
+}
+_BULK_MAX_THREADS = 8
+_BULK_QUEUE_SIZE = 4
+
+# Write-heavy index settings: refreshes are requested explicitly after each batch,
+# and suspended entirely on existing indices while a bulk load runs
+_INDEX_TEMPLATE_NAME = "test-monitoring"
+_INDEX_TEMPLATE_SETTINGS = {
+    "refresh_interval": "30s",
+    "translog.durability": "async",
+    "translog.flush_threshold_size": "1gb",
+    "number_of_replicas": 0
+}
+_SUSPEND_REFRESH = {"refresh_interval": "-1"}
+_RESTORE_REFRESH = {"refresh_interval": _INDEX_TEMPLATE_SETTINGS["refresh_interval"]}
+
+# Shard sizing targets: stay under ~200M documents and ~50 GiB per shard
+_MAX_DOCS_PER_SHARD = 200_000_000
+_MAX_BYTES_PER_SHARD = 50 * 2 ** 30
+_DEFAULT_AVG_DOC_BYTES = 1024
+
+# Hyperscan database ids: timestamp, level, then one id per failure category
+_HS_TIMESTAMP_ID = 0
+_HS_LEVEL_ID = 1
+_HS_FAILURE_IDS = {2: "timeout", 3: "connectivity", 4: "assertion", 5: "memory"}
+_HS_EXPRESSIONS = (
+    rb'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}',
+    rb'INFO|ERROR|WARN|DEBUG',
+    rb'timeout|timed out',
+    rb'connection|network',
+    rb'assertion|expected',
+    rb'memory|oom'
+)
+
+@lru_cache(maxsize=1)
+def _hyperscan_database():
+    """Compile the multi-pattern log database once, if hyperscan is available"""
+    if hyperscan is None:
+        return None
+        
+    som = hyperscan.HS_FLAG_SOM_LEFTMOST
+    flags = [som, som] + [som | hyperscan.HS_FLAG_CASELESS] * len(_HS_FAILURE_IDS)
+    
+    database = hyperscan.Database()
+    database.compile(
+        expressions=list(_HS_EXPRESSIONS),
+        ids=list(range(len(_HS_EXPRESSIONS))),
+        elements=len(_HS_EXPRESSIONS),
+        flags=flags
+    )
+    return database
+
+@lru_cache(maxsize=1)
+def _failure_automaton():
+    """Build the failure keyword automaton once, if pyahocorasick is available"""
+    if ahocorasick is None:
+        return None
+        
+    automaton = ahocorasick.Automaton()
+    for keyword, category in _FAILURE_CATEGORIES.items():
+        automaton.add_word(keyword, category)
+    automaton.make_automaton()
+    return automaton
+
+def _autotune_bulk_threads(max_chunk_bytes: int) -> int:
+    """Size the parallel bulk pool from CPU count, keeping in-flight chunks under a quarter of free memory"""
+    threads = min(_BULK_MAX_THREADS, os.cpu_count() or 1)
+    
+    try:
+        import psutil
+        budget = psutil.virtual_memory().available // 4
+        # Every worker plus every queued chunk may hold a full chunk in memory
+        threads = min(threads, budget // max_chunk_bytes - _BULK_QUEUE_SIZE)
+    except ImportError:
+        pass
+        
+    return max(1, threads)
+
+def _compute_shards(estimated_docs: int, avg_doc_bytes: int = _DEFAULT_AVG_DOC_BYTES) -> int:
+    """Primary shard count that keeps each shard within the document and size targets"""
+    return max(1, math.ceil(max(estimated_docs / _MAX_DOCS_PER_SHARD,
+                                estimated_docs * avg_doc_bytes / _MAX_BYTES_PER_SHARD)))
+
+def _client_options(http_compress: bool = True) -> Dict[str, Any]:
+    """Elasticsearch client options: pooled keep-alive connections, compression and retries"""
+    options = {
+        # Gzip the NDJSON bulk bodies; only worth the CPU when the cluster is across a network
+        "http_compress": http_compress,
+        "connections_per_node": 32,
+        "retry_on_timeout": True,
+        "max_retries": 3,
+        "request_timeout": 60
+    }
+    
+    # Serialize request bodies with orjson when available
+    if orjson is not None:
+        try:
+            from elasticsearch.serializer import OrjsonSerializer
+            options["serializer"] = OrjsonSerializer()
+        except ImportError:
+            pass
+            
+    return options
+
+@lru_cache(maxsize=None)
+def _shared_client(hosts: Tuple[str, ...], http_compress: bool = True) -> Elasticsearch:
+    """One pooled keep-alive client per cluster, shared by every indexer in the process"""
+    return Elasticsearch(list(hosts), **_client_options(http_compress))
+
+def _scan_log_text(data: bytes) -> Optional[Dict[int, Tuple[int, int]]]:
+    """Scan once for all log patterns, returning the first span per pattern id"""
+    database = _hyperscan_database()
+    if database is None:
+        return None
+        
+    spans = {}
+    
+    def on_match(pattern_id, start, end, flags, context):
+        spans.setdefault(pattern_id, (start, end))
+        
+    database.scan(data, match_event_handler=on_match)
+    return spans
+
+# Compact status codes for the columnar test-result store
+_STATUS_PASSED = 0
+_STATUS_FAILED = 1
+_STATUS_CODES = {"passed": _STATUS_PASSED, "failed": _STATUS_FAILED, "skipped": 2, "pending": 3}
+_STATUS_OTHER = len(_STATUS_CODES)
+
+def _aggregate_test_metrics_numpy(status_codes, durations):
+    """Pass/fail counts and duration mean/min/max/std via NumPy reductions"""
+    import numpy as np
+    return (int(np.count_nonzero(status_codes == _STATUS_PASSED)),
+            int(np.count_nonzero(status_codes == _STATUS_FAILED)),
+            float(durations.mean(dtype=np.float64)), float(durations.min()),
+            float(durations.max()), float(durations.std(dtype=np.float64)))
+
+def _aggregate_test_metrics_loop(status_codes, durations):
+    """Pass/fail counts and duration mean/min/max/std in one fused loop (Numba kernel body)"""
+    passed = 0
+    failed = 0
+    for i in range(status_codes.size):
+        code = status_codes[i]
+        if code == _STATUS_PASSED:
+            passed += 1
+        elif code == _STATUS_FAILED:
+            failed += 1
+    total = 0.0
+    total_sq = 0.0
+    lowest = durations[0]
+    highest = durations[0]
+    for i in range(durations.size):
+        value = float(durations[i])
+        total += value
+        total_sq += value * value
+        lowest = min(lowest, durations[i])
+        highest = max(highest, durations[i])
+    mean = total / durations.size
+    variance = max(total_sq / durations.size - mean * mean, 0.0)
+    return passed, failed, mean, lowest, highest, variance ** 0.5
+
+@lru_cache(maxsize=None)
+def _get_test_metrics_aggregator():
+    """JIT-compiled aggregator when numba is installed, otherwise the NumPy one"""
+    try:
+        from numba import njit
+    except ImportError:
+        return _aggregate_test_metrics_numpy
+    return njit(cache=True, fastmath=True)(_aggregate_test_metrics_loop)
+
+_LEVEL_MAP = {
+    "passed": "INFO",
+    "failed": "ERROR",
+    "skipped": "WARN",
+    "pending": "DEBUG"
+}
+
+def _determine_log_level(status: str) -> str:
+    """Determine appropriate log level based on an already lowercased test status"""
+    return _LEVEL_MAP.get(status, "INFO")
+
+def _classify_failure(error_message: str) -> str:
+    """Classify failure type based on error message"""
+    spans = _scan_log_text(error_message.encode("utf-8"))
+    automaton = _failure_automaton()
+    if spans is not None:
+        found = {_HS_FAILURE_IDS[pattern_id] for pattern_id in spans if pattern_id in _HS_FAILURE_IDS}
+    elif automaton is not None:
+        # Single pass over the message for every keyword
+        found = {category for _, category in automaton.iter(error_message.lower())}
+    else:
+        found = {_FAILURE_CATEGORIES[keyword.lower()] for keyword in _FAILURE_RE.findall(error_message)}
+        
+    for category in _FAILURE_PRIORITY:
+        if category in found:
+            return category
+    return "other"
+
+def _enrich_test_result(result: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
+    """Enrich a single test result with indexing metadata"""
+    
+    get = result.get
+    
+    # Normalize the fields used more than once
+    status = get("status") or "unknown"
+    suite = get("suite", "default")
+    
+    enriched_result = {
+        "@timestamp": timestamp,
+        "test_name": get("test_name", "unknown"),
+        "status": status,
+        "duration": get("duration", 0),
+        "environment": get("environment", "test"),
+        "suite": suite,
+        "metadata": get("metadata", {}),
+        "log_level": _determine_log_level(status.lower()),
+        "tags": ["test-result", suite]
+    }
+    
+    # Add performance metrics
+    if "performance" in result:
+        enriched_result["performance"] = result["performance"]
+        
+    # Add error details if failed
+    if status == "failed" and "error" in result:
+        enriched_result["error_details"] = {
+            "message": result["error"],
+            "stack_trace": get("stack_trace", ""),
+            "failure_type": _classify_failure(result["error"])
+        }
+        enriched_result["tags"].append("failure")
+        
+    return enriched_result
+
 # ==================== ELK STACK COMPONENTS ====================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ELKComponent:
     """ELK stack component configuration"""
     name: str
     type: str  # elasticsearch, logstash, kibana
     version: str
     port: int
-    config: Dict[str, Any]
+    config: Dict[str, Any] = field(hash=False)  # treated as read-only once configured
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LogPipeline:
     """Log processing pipeline configuration"""
     name: str
     input_plugin: str
-    filter_plugins: List[str]
+    filter_plugins: List[str] = field(hash=False)
     output_plugin: str
     pattern: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert pipeline to dictionary format"""
+        return {
+            "name": self.name,
+            "input_plugin": self.input_plugin,
+            "filter_plugins": list(self.filter_plugins),
+            "output_plugin": self.output_plugin,
+            "pattern": self.pattern
+        }
 
 class ELKStackManager:
     """Manage ELK stack deployment and configuration"""
@@ -49,6 +391,7 @@ class ELKStackManager:
         self.components = []
         self.pipelines = []
         self.es_client = None
+        self._compose_cache = None
         
     def configure_elasticsearch(self, config: Dict[str, Any] = None) -> ELKComponent:
         """Configure Elasticsearch component"""
@@ -73,6 +416,7 @@ class ELKStackManager:
         )
         
         self.components.append(es_component)
+        self._compose_cache = None
         return es_component
         
     def configure_logstash(self, pipelines: List[LogPipeline] = None) -> ELKComponent:
@@ -99,7 +443,7 @@ class ELKStackManager:
         self.pipelines.extend(pipelines)
         
         logstash_config = {
-            "pipelines": [asdict(pipe) for pipe in pipelines],
+            "pipelines": [pipe.to_dict() for pipe in pipelines],
             "http.port": 9600,
             "http.host": "0.0.0.0"
         }
@@ -113,6 +457,7 @@ class ELKStackManager:
         )
         
         self.components.append(logstash_component)
+        self._compose_cache = None
         return logstash_component
         
     def configure_kibana(self, config: Dict[str, Any] = None) -> ELKComponent:
@@ -135,11 +480,16 @@ class ELKStackManager:
         )
         
         self.components.append(kibana_component)
+        self._compose_cache = None
         return kibana_component
         
     def generate_docker_compose(self) -> Dict[str, Any]:
         """Generate Docker Compose configuration for ELK stack"""
         
+        # Reuse the last result until another component is configured
+        if self._compose_cache is not None:
+            return self._compose_cache
+            
         services = {}
         
         # Elasticsearch service
@@ -196,133 +546,176 @@ class ELKStackManager:
             }
         }
         
+        self._compose_cache = compose_config
         return compose_config
 
 # ==================== LOG PROCESSING PIPELINES ====================
 
+class FileLogSource:
+    """Read log lines from disk in large sequential chunks, prefetching the next chunk while lines are parsed"""
+    
+    def __init__(self, path: Path, chunk_size: int = 1 << 20):
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        
+    def __iter__(self) -> Iterator[str]:
+        with open(self.path, 'rb', buffering=0) as f, ThreadPoolExecutor(max_workers=1) as reader:
+            if hasattr(os, 'posix_fadvise'):
+                # Let the kernel read ahead aggressively for this sequential scan
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                
+            pending = reader.submit(f.read, self.chunk_size)
+            remainder = b""
+            
+            while True:
+                chunk = pending.result()
+                if not chunk:
+                    break
+                # Overlap the next read with parsing of the current chunk
+                pending = reader.submit(f.read, self.chunk_size)
+                
+                lines = (remainder + chunk).split(b"\n")
+                remainder = lines.pop()
+                for line in lines:
+                    line = line.rstrip(b"\r")
+                    if line:
+                        yield line.decode("utf-8", errors="replace")
+                        
+            if remainder.strip():
+                yield remainder.rstrip(b"\r").decode("utf-8", errors="replace")
+
 class LogPipelineProcessor:
     """Process and transform log data for ELK ingestion"""
     
     def __init__(self):
         self.processed_logs = []
+        # Columnar status/duration store for local aggregation
+        self._status_codes = array('b')
+        self._durations = array('f')
         
     def process_test_results(self, test_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process test results for ELK indexing"""
         
-        processed_results = []
+        return list(self.iter_test_results(test_results, on_record=self.processed_logs.append))
+        
+    def iter_test_results(self, test_results: Iterable[Dict[str, Any]],
+                          on_record: Optional[Callable[[Dict[str, Any]], None]] = None
+                          ) -> Iterator[Dict[str, Any]]:
+        """Lazily enrich test results, handing each one to on_record if given"""
+        
+        # One ingestion timestamp per batch
+        timestamp = datetime.now().isoformat()
+        # Metrics never touch the record dicts again, only these typed columns
+        append_status = self._status_codes.append
+        append_duration = self._durations.append
+        status_code = _STATUS_CODES.get
+        enrich = _enrich_test_result
         
         for result in test_results:
-            # Enrich test result data
-            enriched_result = {
-                "@timestamp": datetime.now().isoformat(),
-                "test_name": result.get("test_name", "unknown"),
-                "status": result.get("status", "unknown"),
-                "duration": result.get("duration", 0),
-                "environment": result.get("environment", "test"),
-                "suite": result.get("suite", "default"),
-                "metadata": result.get("metadata", {}),
-                "log_level": self._determine_log_level(result.get("status")),
-                "tags": ["test-result", result.get("suite", "default")]
-            }
-            
-            # Add performance metrics
-            if "performance" in result:
-                enriched_result["performance"] = result["performance"]
+            enriched_result = enrich(result, timestamp)
+            if on_record is not None:
+                on_record(enriched_result)
                 
-            # Add error details if failed
-            if result.get("status") == "failed" and "error" in result:
-                enriched_result["error_details"] = {
-                    "message": result["error"],
-                    "stack_trace": result.get("stack_trace", ""),
-                    "failure_type": self._classify_failure(result["error"])
-                }
-                enriched_result["tags"].append("failure")
-                
-            processed_results.append(enriched_result)
-            self.processed_logs.append(enriched_result)
+            # One row per yielded result, so abandoned or interleaved batches never leave stray rows
+            duration = enriched_result["duration"]
+            append_status(status_code(enriched_result["status"], _STATUS_OTHER))
+            append_duration(duration if isinstance(duration, (int, float)) else 0.0)
+            yield enriched_result
+            
+    def summarize_test_results(self) -> Dict[str, Any]:
+        """Compute test summary metrics from the columnar store without querying Elasticsearch"""
+        import numpy as np
+        
+        status_codes = np.frombuffer(self._status_codes, dtype=np.int8)
+        durations = np.frombuffer(self._durations, dtype=np.float32)
+        
+        total_tests = int(status_codes.size)
+        if not total_tests:
+            return {
+                "total_tests": 0, "passed_tests": 0, "failed_tests": 0,
+                "avg_duration": 0, "min_duration": 0, "max_duration": 0,
+                "duration_std": 0, "p95_duration": 0, "success_rate": 0
+            }
             
-        return processed_results
+        aggregate = _get_test_metrics_aggregator()
+        passed_tests, failed_tests, avg_duration, lowest, highest, std = aggregate(status_codes, durations)
+        
+        return {
+            "total_tests": total_tests,
+            "passed_tests": int(passed_tests),
+            "failed_tests": int(failed_tests),
+            "avg_duration": float(avg_duration),
+            "min_duration": float(lowest),
+            "max_duration": float(highest),
+            "duration_std": float(std),
+            "p95_duration": float(np.percentile(durations, 95)),
+            "success_rate": (passed_tests / total_tests) * 100
+        }
         
     def process_application_logs(self, app_logs: List[str]) -> List[Dict[str, Any]]:
         """Process application logs for structured format"""
         
-        processed_logs = []
+        return list(self.iter_application_logs(app_logs, on_record=self.processed_logs.append))
+        
+    def iter_application_logs(self, app_logs: Iterable[str],
+                              on_record: Optional[Callable[[Dict[str, Any]], None]] = None
+                              ) -> Iterator[Dict[str, Any]]:
+        """Lazily structure application logs, handing each parsed entry to on_record if given"""
+        
+        # One ingestion timestamp per batch
+        timestamp = datetime.now().isoformat()
         
         for log_entry in app_logs:
-            try:
-                # Parse log entry (assuming structured logging)
-                if log_entry.startswith("{"):
-                    log_data = json.loads(log_entry)
-                else:
-                    # Parse unstructured logs
-                    log_data = self._parse_unstructured_log(log_entry)
-                    
-                # Enrich with metadata
-                enriched_log = {
-                    "@timestamp": log_data.get("timestamp", datetime.now().isoformat()),
-                    "log_level": log_data.get("level", "INFO"),
-                    "message": log_data.get("message", log_entry),
-                    "component": log_data.get("component", "unknown"),
-                    "thread": log_data.get("thread", "main"),
-                    "tags": ["application-log"]
-                }
-                
-                # Add structured fields if present
-                if "fields" in log_data:
-                    enriched_log.update(log_data["fields"])
-                    
-                processed_logs.append(enriched_log)
-                self.processed_logs.append(enriched_log)
+            # Parse log entry, only structured entries can fail to decode
+            if log_entry.startswith("{"):
+                try:
+                    log_data = _decode_log_line(log_entry)
+                except _LOG_DECODE_ERRORS as e:
+                    # Handle parsing errors
+                    yield {
+                        "@timestamp": timestamp,
+                        "log_level": "ERROR",
+                        "message": f"Log parsing failed: {e}",
+                        "original_log": log_entry[:200],  # First 200 chars
+                        "tags": ["parsing-error"]
+                    }
+                    continue
+            else:
+                # Parse unstructured logs
+                log_data = self._parse_unstructured_log(log_entry, timestamp)
                 
-            except Exception as e:
-                # Handle parsing errors
-                error_log = {
-                    "@timestamp": datetime.now().isoformat(),
-                    "log_level": "ERROR",
-                    "message": f"Log parsing failed: {e}",
-                    "original_log": log_entry[:200],  # First 200 chars
-                    "tags": ["parsing-error"]
-                }
-                processed_logs.append(error_log)
+            # Decoded structs know their schema, plain dicts fall back to keyed lookups
+            if type(log_data) is dict:
+                enriched_log = _enrich_log_data(log_data, log_entry, timestamp)
+            else:
+                enriched_log = log_data.enrich(log_entry, timestamp)
                 
-        return processed_logs
-        
-    def _determine_log_level(self, status: str) -> str:
-        """Determine appropriate log level based on test status"""
-        level_mapping = {
-            "passed": "INFO",
-            "failed": "ERROR",
-            "skipped": "WARN",
-            "pending": "DEBUG"
-        }
-        return level_mapping.get(status.lower(), "INFO")
-        
-    def _classify_failure(self, error_message: str) -> str:
-        """Classify failure type based on error message"""
-        error_lower = error_message.lower()
-        
-        if "timeout" in error_lower or "timed out" in error_lower:
-            return "timeout"
-        elif "connection" in error_lower or "network" in error_lower:
-            return "connectivity"
-        elif "assertion" in error_lower or "expected" in error_lower:
-            return "assertion"
-        elif "memory" in error_lower or "oom" in error_lower:
-            return "memory"
-        else:
-            return "other"
-            
-    def _parse_unstructured_log(self, log_entry: str) -> Dict[str, Any]:
-        """Parse unstructured log entry into structured format"""
-        # Simple regex-based parsing (would be enhanced with proper log parsing library)
-        import re
+            if on_record is not None:
+                on_record(enriched_log)
+            yield enriched_log
         
+    def _parse_unstructured_log(self, log_entry: str, default_timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """Parse unstructured log entry into structured format"""
+        if default_timestamp is None:
+            default_timestamp = datetime.now().isoformat()
+            
+        data = log_entry.encode("utf-8")
+        spans = _scan_log_text(data)
+        if spans is not None:
+            timestamp_span = spans.get(_HS_TIMESTAMP_ID)
+            level_span = spans.get(_HS_LEVEL_ID)
+            return {
+                "timestamp": data[slice(*timestamp_span)].decode() if timestamp_span else default_timestamp,
+                "level": data[slice(*level_span)].decode() if level_span else "INFO",
+                "message": log_entry
+            }
+            
         # Extract timestamp (ISO format)
-        timestamp_match = re.search(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}', log_entry)
-        timestamp = timestamp_match.group() if timestamp_match else datetime.now().isoformat()
+        timestamp_match = _TIMESTAMP_RE.search(log_entry)
+        timestamp = timestamp_match.group() if timestamp_match else default_timestamp
         
         # Extract log level
-        level_match = re.search(r'(INFO|ERROR|WARN|DEBUG)', log_entry)
+        level_match = _LEVEL_RE.search(log_entry)
         level = level_match.group() if level_match else "INFO"
         
         return {
@@ -331,15 +724,91 @@ class LogPipelineProcessor:
             "message": log_entry
         }
 
+def _enrich_log_data(log_data: Dict[str, Any], log_entry: str, timestamp: str) -> Dict[str, Any]:
+    """Enrich a parsed log dict with metadata"""
+    enriched_log = {
+        "@timestamp": log_data.get("timestamp", timestamp),
+        "log_level": log_data.get("level", "INFO"),
+        "message": log_data.get("message", log_entry),
+        "component": log_data.get("component", "unknown"),
+        "thread": log_data.get("thread", "main"),
+        "tags": ["application-log"]
+    }
+    
+    # Add structured fields if present
+    fields = log_data.get("fields")
+    if isinstance(fields, dict):
+        enriched_log.update(fields)
+    return enriched_log
+
 # ==================== GRAFANA DASHBOARD CREATION ====================
 
 class GrafanaDashboardManager:
     """Manage Grafana dashboard creation and configuration"""
     
-    def __init__(self, grafana_url: str = "http://localhost:3000"):
+    def __init__(self, grafana_url: str = "http://localhost:3000", api_key: Optional[str] = None):
         self.grafana_url = grafana_url
+        self.api_key = api_key
         self.dashboards = []
         
+    def publish_dashboards(self) -> List[Dict[str, Any]]:
+        """Publish all created dashboards to Grafana concurrently"""
+        
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            # Sequential fallback over the synchronous client
+            return [self._publish_dashboard_sync(dashboard) for dashboard in self.dashboards]
+            
+        return asyncio.run(self._publish_dashboards_async())
+        
+    async def _publish_dashboards_async(self) -> List[Dict[str, Any]]:
+        """Overlap every dashboard upload on one pooled aiohttp session"""
+        import aiohttp
+        
+        connector = aiohttp.TCPConnector(limit=16)
+        async with aiohttp.ClientSession(connector=connector, headers=self._api_headers()) as session:
+            return await asyncio.gather(
+                *(self._publish_dashboard(session, dashboard) for dashboard in self.dashboards)
+            )
+            
+    async def _publish_dashboard(self, session, dashboard: Dict[str, Any]) -> Dict[str, Any]:
+        """Upload one dashboard through the Grafana dashboards API"""
+        
+        title = dashboard["dashboard"]["title"]
+        try:
+            async with session.post(f"{self.grafana_url}/api/dashboards/db", data=_json_dumps(dashboard)) as response:
+                body = await response.json(content_type=None)
+                return self._publish_result(title, response.status, body)
+        except Exception as e:
+            return {"title": title, "status": "error", "error": str(e)}
+            
+    def _publish_dashboard_sync(self, dashboard: Dict[str, Any]) -> Dict[str, Any]:
+        """Upload one dashboard with requests when aiohttp is unavailable"""
+        
+        title = dashboard["dashboard"]["title"]
+        try:
+            response = requests.post(f"{self.grafana_url}/api/dashboards/db", data=_json_dumps(dashboard),
+                                     headers=self._api_headers(), timeout=30)
+            return self._publish_result(title, response.status_code, response.json())
+        except Exception as e:
+            return {"title": title, "status": "error", "error": str(e)}
+            
+    def _api_headers(self) -> Dict[str, str]:
+        """Request headers for the Grafana HTTP API"""
+        
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        return headers
+        
+    def _publish_result(self, title: str, status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize a Grafana dashboards API response"""
+        
+        if status_code == 200:
+            return {"title": title, "status": "published", "uid": body.get("uid"), "url": body.get("url")}
+        return {"title": title, "status": "error", "error": body.get("message", f"HTTP {status_code}")}
+        
     def create_test_metrics_dashboard(self) -> Dict[str, Any]:
         """Create comprehensive test metrics dashboard"""
         
@@ -508,71 +977,247 @@ class GrafanaDashboardManager:
                 }
             ]
         }
+        
+    def _create_disk_panel(self) -> Dict[str, Any]:
+        """Create disk I/O panel"""
+        return {
+            "type": "timeseries",
+            "title": "Disk I/O Bytes",
+            "gridPos": {"x": 0, "y": 8, "w": 12, "h": 8},
+            "targets": [
+                {
+                    "refId": "A",
+                    "query": "SELECT avg(disk_io) FROM system-metrics GROUP BY date_histogram(@timestamp, '1m')",
+                    "alias": "Disk I/O"
+                }
+            ]
+        }
+        
+    def _create_network_panel(self) -> Dict[str, Any]:
+        """Create network I/O panel"""
+        return {
+            "type": "timeseries",
+            "title": "Network I/O Bytes",
+            "gridPos": {"x": 12, "y": 8, "w": 12, "h": 8},
+            "targets": [
+                {
+                    "refId": "A",
+                    "query": "SELECT avg(network_io) FROM system-metrics GROUP BY date_histogram(@timestamp, '1m')",
+                    "alias": "Network I/O"
+                }
+            ]
+        }
 
 # ==================== DATA INDEXING & QUERYING ====================
 
+def _document_id(document: Dict[str, Any], run_id: Optional[str] = None) -> str:
+    """Id for a document within one run; without a run id its batch @timestamp identifies the run"""
+    if run_id is None:
+        return _content_id(_encode_source(document))
+    source = {key: value for key, value in document.items() if key != "@timestamp"}
+    return _content_id(run_id.encode("utf-8") + b"\0" + _encode_source(source))
+
+class _BulkActionStream:
+    """Stream documents to the bulk helpers as actions, counting what was sent"""
+    
+    def __init__(self, index: str, documents: Iterable[Dict[str, Any]], content_ids: bool = False,
+                 run_id: Optional[str] = None):
+        self.index = index
+        self.documents = documents
+        self.content_ids = content_ids
+        self.run_id = run_id
+        self.count = 0
+        
+    def __iter__(self) -> Iterator[Any]:
+        # Sources are encoded exactly once and pass through the client serializer untouched
+        encode = _encode_source
+        if self.content_ids:
+            # Ids are scoped to one run, so only a replay of that run overwrites its
+            # documents; identical results within a run are numbered by occurrence
+            # so each still gets its own document
+            index = self.index
+            run_id = self.run_id
+            occurrences = {}
+            for document in self.documents:
+                self.count += 1
+                source = encode(document)
+                doc_id = _document_id(document, run_id)
+                seen = occurrences.get(doc_id, 0)
+                occurrences[doc_id] = seen + 1
+                if seen:
+                    doc_id = f"{doc_id}-{seen}"
+                yield {"_index": index, "_id": doc_id, "_source": source}
+        else:
+            # Raw bytes get a constant action line, with no per-document metadata copy
+            for document in self.documents:
+                self.count += 1
+                yield encode(document)
+
 class ELKDataIndexer:
     """Index data into Elasticsearch and perform queries"""
     
-    def __init__(self, es_host: str = "localhost", es_port: int = 9200):
-        self.es_client = Elasticsearch([f"http://{es_host}:{es_port}"])
+    def __init__(self, es_host: str = "localhost", es_port: int = 9200,
+                 chunk_size: int = _DEFAULT_CHUNK_SIZE, max_chunk_bytes: int = _DEFAULT_MAX_CHUNK_BYTES,
+                 http_compress: bool = True, es_client: Optional[Elasticsearch] = None):
+        self.chunk_size = chunk_size
+        self.max_chunk_bytes = max_chunk_bytes
+        self.http_compress = http_compress
+        self.es_hosts = [f"http://{es_host}:{es_port}"]
+        self.es_client = es_client or _shared_client(tuple(self.es_hosts), http_compress)
         self.indices = {
             "test-results": "test_results_index",
             "application-logs": "app_logs_index",
             "system-metrics": "system_metrics_index"
         }
+        self._template_applied = False
+        self._async_client: Optional[AsyncElasticsearch] = None
+        
+    def apply_index_template(self, estimated_docs: int = 0,
+                             avg_doc_bytes: int = _DEFAULT_AVG_DOC_BYTES) -> Dict[str, Any]:
+        """Install write-optimized settings for the monitoring indices before they are created"""
         
-    def index_test_results(self, test_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        shards = _compute_shards(estimated_docs, avg_doc_bytes)
+        
+        try:
+            self.es_client.indices.put_index_template(
+                name=_INDEX_TEMPLATE_NAME,
+                index_patterns=list(self.indices.values()),
+                template={"settings": dict(_INDEX_TEMPLATE_SETTINGS, number_of_shards=shards)}
+            )
+            self._template_applied = True
+            return {"status": "applied", "template": _INDEX_TEMPLATE_NAME, "shards": shards}
+        except Exception as e:
+            return {"error": str(e)}
+            
+    def index_test_results(self, test_results: List[Dict[str, Any]],
+                           run_id: Optional[str] = None) -> Dict[str, Any]:
         """Index test results into Elasticsearch"""
         
+        return self._bulk_index(self.indices["test-results"], test_results, content_ids=True, run_id=run_id)
+        
+    def index_application_logs(self, logs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Index application logs into Elasticsearch"""
+        
+        return self._bulk_index(self.indices["application-logs"], logs)
+        
+    def _bulk_index(self, index: str, documents: Iterable[Dict[str, Any]],
+                    content_ids: bool = False, run_id: Optional[str] = None) -> Dict[str, Any]:
+        """Index documents through the bulk API in batched requests"""
+        
+        if not self._template_applied:
+            self.apply_index_template()
+            
+        actions = _BulkActionStream(index, documents, content_ids, run_id)
         indexed_count = 0
         errors = []
         
-        for result in test_results:
-            try:
-                # Index document
-                response = self.es_client.index(
-                    index=self.indices["test-results"],
-                    document=result
-                )
-                
-                if response.get("result") == "created":
+        # Best effort: indices created by this load start from the template's interval
+        try:
+            self.es_client.indices.put_settings(index=index, settings=_SUSPEND_REFRESH, ignore_unavailable=True)
+        except Exception:
+            pass
+            
+        try:
+            for ok, info in parallel_bulk(self.es_client, actions, index=index, chunk_size=self.chunk_size,
+                                          max_chunk_bytes=self.max_chunk_bytes,
+                                          thread_count=_autotune_bulk_threads(self.max_chunk_bytes),
+                                          queue_size=_BULK_QUEUE_SIZE, **_BULK_OPTIONS):
+                if ok:
                     indexed_count += 1
-                    
-            except Exception as e:
-                errors.append(f"Failed to index result {result.get('test_name')}: {e}")
-                
-        return {
-            "indexed_count": indexed_count,
-            "total_count": len(test_results),
-            "errors": errors,
-            "success_rate": (indexed_count / len(test_results)) * 100 if test_results else 0
-        }
+                else:
+                    errors.append(f"Failed to index document: {info}")
+        except Exception as e:
+            errors.append(f"Bulk indexing failed: {e}")
+            
+        # Restore scheduled refreshes, then make the batch searchable once
+        try:
+            self.es_client.indices.put_settings(index=index, settings=_RESTORE_REFRESH, ignore_unavailable=True)
+            self.es_client.indices.refresh(index=index)
+        except Exception as e:
+            errors.append(f"Index refresh failed: {e}")
+            
+        return self._indexing_summary(indexed_count, errors, actions.count)
         
-    def index_application_logs(self, logs: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Index application logs into Elasticsearch"""
+    async def index_test_data_async(self, test_results: Iterable[Dict[str, Any]],
+                                    logs: Optional[Iterable[Dict[str, Any]]] = None,
+                                    run_id: Optional[str] = None
+                                    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Index test results and logs concurrently over the async client"""
+        
+        if not self._template_applied:
+            # The template goes through the sync client, so keep it off the event loop
+            await asyncio.to_thread(self.apply_index_template)
+            
+        async_client = self._get_async_client()
+        
+        indices = [self.indices["test-results"]]
+        tasks = [self._async_bulk_index(async_client, indices[0], test_results, content_ids=True, run_id=run_id)]
+        if logs is not None:
+            indices.append(self.indices["application-logs"])
+            tasks.append(self._async_bulk_index(async_client, indices[1], logs))
+            
+        # Best effort: indices created by this load start from the template's interval
+        try:
+            await async_client.indices.put_settings(index=indices, settings=_SUSPEND_REFRESH,
+                                                    ignore_unavailable=True)
+        except Exception:
+            pass
+            
+        summaries = await asyncio.gather(*tasks)
+        
+        # Restore scheduled refreshes, then make the batches searchable once
+        try:
+            await async_client.indices.put_settings(index=indices, settings=_RESTORE_REFRESH,
+                                                    ignore_unavailable=True)
+            await async_client.indices.refresh(index=indices)
+        except Exception as e:
+            summaries[0]["errors"].append(f"Index refresh failed: {e}")
+            
+        return summaries[0], (summaries[1] if logs is not None else None)
+        
+    def _get_async_client(self) -> AsyncElasticsearch:
+        """Long-lived async client, bound to the event loop that first uses it"""
+        
+        if self._async_client is None:
+            self._async_client = AsyncElasticsearch(self.es_hosts, **_client_options(self.http_compress))
+        return self._async_client
+        
+    async def close_async(self):
+        """Close the async client's connection pool"""
+        
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
         
+    async def _async_bulk_index(self, async_client: AsyncElasticsearch, index: str,
+                                documents: Iterable[Dict[str, Any]], content_ids: bool = False,
+                                run_id: Optional[str] = None) -> Dict[str, Any]:
+        """Bulk index documents without blocking the event loop"""
+        
+        actions = _BulkActionStream(index, documents, content_ids, run_id)
         indexed_count = 0
         errors = []
         
-        for log in logs:
-            try:
-                response = self.es_client.index(
-                    index=self.indices["application-logs"],
-                    document=log
-                )
-                
-                if response.get("result") == "created":
+        try:
+            async for ok, info in async_streaming_bulk(async_client, actions, index=index, chunk_size=self.chunk_size,
+                                                       max_chunk_bytes=self.max_chunk_bytes, **_BULK_OPTIONS):
+                if ok:
                     indexed_count += 1
-                    
-            except Exception as e:
-                errors.append(f"Failed to index log: {e}")
-                
+                else:
+                    errors.append(f"Failed to index document: {info}")
+        except Exception as e:
+            errors.append(f"Bulk indexing failed: {e}")
+            
+        return self._indexing_summary(indexed_count, errors, actions.count)
+        
+    def _indexing_summary(self, indexed_count: int, errors: List[str], total_count: int) -> Dict[str, Any]:
+        """Build the indexing result reported to callers"""
+        
         return {
             "indexed_count": indexed_count,
-            "total_count": len(logs),
+            "total_count": total_count,
             "errors": errors,
-            "success_rate": (indexed_count / len(logs)) * 100 if logs else 0
+            "success_rate": indexed_count * 100.0 / max(1, total_count)
         }
         
     def query_test_metrics(self, timeframe: str = "24h") -> Dict[str, Any]:
@@ -648,16 +1293,43 @@ class ELKDataIndexer:
 class MonitoringOrchestrator:
     """Orchestrate complete monitoring and observability solution"""
     
-    def __init__(self):
+    def __init__(self, chunk_size: int = _DEFAULT_CHUNK_SIZE, max_chunk_bytes: int = _DEFAULT_MAX_CHUNK_BYTES,
+                 http_compress: bool = True):
         self.elk_manager = ELKStackManager()
         self.pipeline_processor = LogPipelineProcessor()
         self.dashboard_manager = GrafanaDashboardManager()
-        self.data_indexer = ELKDataIndexer()
+        self.data_indexer = ELKDataIndexer(chunk_size=chunk_size, max_chunk_bytes=max_chunk_bytes,
+                                           http_compress=http_compress)
         self.monitoring_results = []
+        self._setup_results = {}
+        self._event_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+    def _run_async(self, coroutine):
+        """Run a coroutine on the orchestrator's own loop, which keeps the indexer's async client usable"""
+        
+        if self._event_loop is None:
+            self._event_loop = asyncio.new_event_loop()
+        return self._event_loop.run_until_complete(coroutine)
         
-    def setup_complete_monitoring_stack(self) -> Dict[str, Any]:
+    def close(self):
+        """Release the async client and the orchestrator's event loop"""
+        
+        if self._event_loop is not None:
+            self._event_loop.run_until_complete(self.data_indexer.close_async())
+            self._event_loop.close()
+            self._event_loop = None
+            
+    def setup_complete_monitoring_stack(self, publish_dashboards: bool = False,
+                                        estimated_docs: Optional[int] = None) -> Dict[str, Any]:
         """Setup complete ELK + Grafana monitoring stack"""
         
+        # Repeated setups against the same targets replay the first result
+        setup_key = (self.dashboard_manager.grafana_url, tuple(self.data_indexer.es_hosts),
+                     publish_dashboards, estimated_docs)
+        if setup_key in self._setup_results:
+            print("✅ Monitoring stack already set up, reusing configuration")
+            return self._setup_results[setup_key]
+            
         print("📊 Setting up Complete Monitoring Stack")
         print("=" * 45)
         
@@ -675,6 +1347,14 @@ class MonitoringOrchestrator:
         test_dashboard = self.dashboard_manager.create_test_metrics_dashboard()
         system_dashboard = self.dashboard_manager.create_system_metrics_dashboard()
         
+        # Size index shards up front when the expected data volume is known
+        index_template = None
+        if estimated_docs is not None:
+            index_template = self.data_indexer.apply_index_template(estimated_docs=estimated_docs)
+            
+        # Optionally push the dashboards to Grafana, all uploads in flight at once
+        publish_results = self.dashboard_manager.publish_dashboards() if publish_dashboards else []
+        
         setup_end = datetime.now()
         
         result = {
@@ -682,12 +1362,16 @@ class MonitoringOrchestrator:
             "pipelines_created": len(self.elk_manager.pipelines),
             "dashboards_created": len(self.dashboard_manager.dashboards),
             "docker_compose_generated": True,
+            "dashboards_published": sum(1 for r in publish_results if r["status"] == "published"),
+            "publish_results": publish_results,
+            "index_template": index_template,
             "setup_start": setup_start.isoformat(),
             "setup_end": setup_end.isoformat(),
             "setup_duration": (setup_end - setup_start).total_seconds()
         }
         
         self.monitoring_results.append(result)
+        self._setup_results[setup_key] = result
         
         print(f"✅ Monitoring stack setup completed")
         print(f"   Components: {result['components_configured']}")
@@ -697,7 +1381,8 @@ class MonitoringOrchestrator:
         return result
         
     def process_and_index_test_data(self, test_results: List[Dict[str, Any]], 
-                                  app_logs: List[str] = None) -> Dict[str, Any]:
+                                  app_logs: Optional[Any] = None,
+                                  run_id: Optional[str] = None) -> Dict[str, Any]:
         """Process test data and index into monitoring system"""
         
         print("🔄 Processing and Indexing Test Data")
@@ -705,24 +1390,41 @@ class MonitoringOrchestrator:
         
         processing_start = datetime.now()
         
-        # Process test results
-        processed_results = self.pipeline_processor.process_test_results(test_results)
-        indexing_result = self.data_indexer.index_test_results(processed_results)
-        
-        # Process application logs if provided
-        log_indexing_result = None
+        # Stream processed test results and application logs straight into bulk indexing;
+        # re-submitting a run with the same run_id overwrites its documents
+        processed_results = self.pipeline_processor.iter_test_results(test_results)
+        processed_logs = None
+        if isinstance(app_logs, (str, os.PathLike)):
+            # Stream log files from disk instead of holding every line in memory
+            app_logs = FileLogSource(app_logs)
         if app_logs:
-            processed_logs = self.pipeline_processor.process_application_logs(app_logs)
-            log_indexing_result = self.data_indexer.index_application_logs(processed_logs)
+            processed_logs = self.pipeline_processor.iter_application_logs(app_logs)
+            
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Index both batches concurrently
+            indexing_result, log_indexing_result = self._run_async(
+                self.data_indexer.index_test_data_async(processed_results, processed_logs, run_id)
+            )
+        else:
+            # Already inside a running loop, which cannot be blocked on: index synchronously
+            indexing_result = self.data_indexer.index_test_results(processed_results, run_id)
+            log_indexing_result = None
+            if processed_logs is not None:
+                log_indexing_result = self.data_indexer.index_application_logs(processed_logs)
             
         # Query metrics
         test_metrics = self.data_indexer.query_test_metrics()
+        if "error" in test_metrics:
+            # Fall back to the processor's local aggregation
+            test_metrics = self.pipeline_processor.summarize_test_results()
         failure_patterns = self.data_indexer.query_failure_patterns()
         
         processing_end = datetime.now()
         
         result = {
-            "processed_test_results": len(processed_results),
+            "processed_test_results": indexing_result["total_count"],
             "test_indexing_result": indexing_result,
             "log_processing_result": log_indexing_result,
             "test_metrics": test_metrics,
@@ -735,7 +1437,7 @@ class MonitoringOrchestrator:
         self.monitoring_results.append(result)
         
         print(f"✅ Data processing completed")
-        print(f"   Test Results Processed: {len(processed_results)}")
+        print(f"   Test Results Processed: {result['processed_test_results']}")
         print(f"   Indexing Success Rate: {indexing_result['success_rate']:.1f}%")
         print(f"   Processing Time: {result['processing_duration']:.2f}s")
         
@@ -743,6 +1445,54 @@ class MonitoringOrchestrator:
 
 # ==================== DEMONSTRATION ====================
 
+# Sample test results, built once at import rather than on every demo run
+_SAMPLE_TEST_RESULTS = (
+    {
+        "test_name": "test_user_authentication",
+        "status": "passed",
+        "duration": 125,
+        "environment": "staging",
+        "suite": "auth-tests"
+    },
+    {
+        "test_name": "test_content_generation",
+        "status": "failed",
+        "duration": 2500,
+        "environment": "staging", 
+        "suite": "generation-tests",
+        "error": "Timeout occurred while generating content"
+    },
+    {
+        "test_name": "test_api_endpoints",
+        "status": "passed",
+        "duration": 89,
+        "environment": "production",
+        "suite": "api-tests"
+    }
+)
+
+# Sample application logs
+_SAMPLE_LOGS = (
+    '{"timestamp": "2023-01-15T10:30:00", "level": "INFO", "message": "User login successful", "component": "auth-service"}',
+    '{"timestamp": "2023-01-15T10:31:00", "level": "ERROR", "message": "Database connection failed", "component": "db-service"}',
+    '{"timestamp": "2023-01-15T10:32:00", "level": "WARN", "message": "High memory usage detected", "component": "memory-manager"}'
+)
+
+# Demo report layout, formatted in one pass per section
+_RESULTS_TEMPLATE = (
+    "\n📊 MONITORING IMPLEMENTATION RESULTS:\n"
+    "Stack Components: {components_configured}\n"
+    "Dashboards Created: {dashboards_created}\n"
+    "Test Results Processed: {processed_test_results}\n"
+    "Data Indexing Success: {indexing_success_rate:.1f}%\n"
+)
+_METRICS_TEMPLATE = (
+    "\n📈 SAMPLE METRICS:\n"
+    "Total Tests: {total_tests}\n"
+    "Pass Rate: {success_rate:.1f}%\n"
+    "Avg Duration: {avg_duration:.1f}ms\n"
+)
+
 def demonstrate_monitoring_capabilities():
     """Demonstrate monitoring and observability capabilities"""
     
@@ -791,56 +1541,28 @@ def run_monitoring_demo():
     # Setup monitoring stack
     stack_result = orchestrator.setup_complete_monitoring_stack()
     
-    # Sample test results
-    sample_test_results = [
-        {
-            "test_name": "test_user_authentication",
-            "status": "passed",
-            "duration": 125,
-            "environment": "staging",
-            "suite": "auth-tests"
-        },
-        {
-            "test_name": "test_content_generation",
-            "status": "failed",
-            "duration": 2500,
-            "environment": "staging", 
-            "suite": "generation-tests",
-            "error": "Timeout occurred while generating content"
-        },
-        {
-            "test_name": "test_api_endpoints",
-            "status": "passed",
-            "duration": 89,
-            "environment": "production",
-            "suite": "api-tests"
-        }
-    ]
-    
-    # Sample application logs
-    sample_logs = [
-        '{"timestamp": "2023-01-15T10:30:00", "level": "INFO", "message": "User login successful", "component": "auth-service"}',
-        '{"timestamp": "2023-01-15T10:31:00", "level": "ERROR", "message": "Database connection failed", "component": "db-service"}',
-        '{"timestamp": "2023-01-15T10:32:00", "level": "WARN", "message": "High memory usage detected", "component": "memory-manager"}'
-    ]
-    
     # Process and index data
-    data_result = orchestrator.process_and_index_test_data(sample_test_results, sample_logs)
+    try:
+        data_result = orchestrator.process_and_index_test_data(_SAMPLE_TEST_RESULTS, _SAMPLE_LOGS)
+    finally:
+        orchestrator.close()
     
-    print(f"\n📊 MONITORING IMPLEMENTATION RESULTS:")
-    print(f"Stack Components: {stack_result['components_configured']}")
-    print(f"Dashboards Created: {stack_result['dashboards_created']}")
-    print(f"Test Results Processed: {data_result['processed_test_results']}")
-    print(f"Data Indexing Success: {data_result['test_indexing_result']['success_rate']:.1f}%")
+    # Collect the report and emit it in a single write
+    report = _RESULTS_TEMPLATE.format_map({
+        "components_configured": stack_result['components_configured'],
+        "dashboards_created": stack_result['dashboards_created'],
+        "processed_test_results": data_result['processed_test_results'],
+        "indexing_success_rate": data_result['test_indexing_result']['success_rate']
+    })
     
     # Display sample metrics
     metrics = data_result['test_metrics']
     if 'error' not in metrics:
-        print(f"\n📈 SAMPLE METRICS:")
-        print(f"Total Tests: {metrics['total_tests']}")
-        print(f"Pass Rate: {metrics['success_rate']:.1f}%")
-        print(f"Avg Duration: {metrics['avg_duration']:.1f}ms")
+        report += _METRICS_TEMPLATE.format_map(metrics)
         
+    sys.stdout.write(report)
+    
+
     return {
         "stack_setup": stack_result,
         "data_processing": data_result
@@ -14,32 +14,98 @@ Key Benefits:
 - Natural language-like test expressions
 """
 
-from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Optional, Callable
+from typing import Any, List, Dict, Optional, Callable, Union, Protocol, runtime_checkable, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
 import time
-from selenium.webdriver.remote.webdriver import WebDriver
+import warnings
+# Only the locator constants are needed at import time; the rest of Selenium
+# is imported when a browser ability is initialized
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+_CONDITION_POLL_INTERVAL = 0.1
+
+_USERNAME_LOC = (By.ID, "username")
+_PASSWORD_LOC = (By.ID, "password")
+_LOGIN_BUTTON_LOC = (By.ID, "login-button")
+_LOGOUT_LOC = (By.ID, "logout-button")
+_DASHBOARD_LINK = (By.LINK_TEXT, "Dashboard")
+_PROFILE_LINK = (By.LINK_TEXT, "Profile")
+
+# Locator strategies TaskBatch can resolve inside a single execute_script call
+_BATCHABLE_LOCATORS = frozenset((By.ID, By.NAME, By.CSS_SELECTOR))
+_BATCH_SCRIPT = """
+var steps = arguments[0], elements = [], setters = [];
+// Resolve and vet every element first, so the batch runs whole or not at all
+for (var i = 0; i < steps.length; i++) {
+    var op = steps[i][0], by = steps[i][1], selector = steps[i][2];
+    var el = by === 'id' ? document.getElementById(selector)
+           : by === 'name' ? document.getElementsByName(selector)[0]
+           : document.querySelector(selector);
+    if (!el || el.matches(':disabled')) return false;
+    // The interactability Selenium would demand: rendered, visible and, for clicks, not covered
+    var rect = el.getBoundingClientRect(), style = window.getComputedStyle(el);
+    if (!rect.width || !rect.height || style.visibility !== 'visible' || style.opacity === '0') return false;
+    if (op === 'click') {
+        var hit = document.elementFromPoint(rect.left + rect.width / 2, rect.top + rect.height / 2);
+        if (!hit || !el.contains(hit)) return false;
+        setters.push(null);
+    } else {
+        if (el.readOnly) return false;
+        // Native value setter from the nearest prototype defining one, so framework value trackers see the change
+        var proto = Object.getPrototypeOf(el), desc;
+        while (proto && !(desc = Object.getOwnPropertyDescriptor(proto, 'value'))) {
+            proto = Object.getPrototypeOf(proto);
+        }
+        if (!desc || !desc.set) return false;
+        setters.push(desc.set);
+    }
+    elements.push(el);
+}
+for (var i = 0; i < steps.length; i++) {
+    var el = elements[i];
+    if (steps[i][0] === 'click') {
+        el.click();
+    } else {
+        el.focus();
+        setters[i].call(el, steps[i][3]);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+}
+return true;
+"""
 
 # ==================== CORE SCREENPLAY CLASSES ====================
 
 class Actor:
     """Represents a user performing actions in the system"""
     
+    __slots__ = ("name", "_browser", "abilities", "questions")
+    
     def __init__(self, name: str):
         self.name = name
+        self._browser = None
         self.abilities = {}
         self.questions = []
         
     def can(self, ability_name: str, ability) -> 'Actor':
         """Grant an ability to the actor"""
         self.abilities[ability_name] = ability
+        if ability_name == "browse_the_web":
+            self._browser = ability
         return self
         
+    @property
+    def browser(self):
+        """The actor's browse_the_web ability"""
+        if self._browser is None:
+            raise ValueError(f"Actor {self.name} doesn't have ability: browse_the_web")
+        return self._browser
+        
     def attempts_to(self, *tasks) -> 'Actor':
         """Attempt to perform one or more tasks"""
         for task in tasks:
@@ -58,49 +124,65 @@ class Actor:
             raise ValueError(f"Actor {self.name} doesn't have ability: {ability_name}")
         return self.abilities[ability_name]
 
-class Ability(ABC):
-    """Abstract base class for actor abilities"""
+@runtime_checkable
+class Ability(Protocol):
+    """Structural interface for actor abilities"""
     
-    @abstractmethod
     def initialize(self, **kwargs):
         """Initialize the ability with required parameters"""
-        pass
+        ...
 
-class Task(ABC):
-    """Abstract base class for test tasks"""
+@runtime_checkable
+class Task(Protocol):
+    """Structural interface for test tasks"""
     
-    @abstractmethod
     def perform_as(self, actor: Actor):
         """Perform the task as the given actor"""
-        pass
+        ...
 
-class Question(ABC):
-    """Abstract base class for test questions/verifications"""
+@runtime_checkable
+class Question(Protocol):
+    """Structural interface for test questions/verifications"""
     
-    @abstractmethod
     def answered_by(self, actor: Actor) -> Any:
         """Answer the question from the actor's perspective"""
-        pass
+        ...
 
 # ==================== WEB BROWSER ABILITY ====================
 
 @dataclass
 class BrowserConfig:
     """Browser configuration settings"""
-    driver: WebDriver
+    driver: 'WebDriver'
     base_url: str
     default_timeout: int = 10
     implicit_wait: int = 5
 
-class BrowseTheWeb(Ability):
+class _UninitializedBrowser:
+    """Stand-in config that fails on first use of an uninitialized BrowseTheWeb"""
+    
+    __slots__ = ()
+    
+    def __getattr__(self, name):
+        # Protocol lookups (copy, pickle, hasattr on dunders) must see a plain missing attribute
+        if name.startswith("__"):
+            raise AttributeError(name)
+        raise RuntimeError("Browser not initialized")
+
+class BrowseTheWeb:
     """Ability to interact with web browsers"""
     
     def __init__(self):
-        self.browser_config: Optional[BrowserConfig] = None
+        self.browser_config: Union[BrowserConfig, _UninitializedBrowser] = _UninitializedBrowser()
         
-    def initialize(self, driver: WebDriver, base_url: str, 
+    def initialize(self, driver: 'WebDriver', base_url: str, 
                    default_timeout: int = 10, implicit_wait: int = 5):
         """Initialize browser ability"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        self._WebDriverWait = WebDriverWait
+        self._EC = EC
+        
         self.browser_config = BrowserConfig(
             driver=driver,
             base_url=base_url,
@@ -111,50 +193,39 @@ class BrowseTheWeb(Ability):
         
     def navigate_to(self, url: str):
         """Navigate to URL"""
-        if not self.browser_config:
-            raise RuntimeError("Browser not initialized")
-            
         full_url = f"{self.browser_config.base_url}{url}" if not url.startswith('http') else url
         self.browser_config.driver.get(full_url)
         
     def find_element(self, locator: tuple, timeout: int = None) -> Any:
         """Find element with explicit wait"""
-        if not self.browser_config:
-            raise RuntimeError("Browser not initialized")
-            
+        driver = self.browser_config.driver
         wait_time = timeout or self.browser_config.default_timeout
-        return WebDriverWait(self.browser_config.driver, wait_time).until(
-            EC.presence_of_element_located(locator)
+        return self._WebDriverWait(driver, wait_time).until(
+            self._EC.presence_of_element_located(locator)
         )
         
     def find_elements(self, locator: tuple, timeout: int = None) -> List[Any]:
         """Find multiple elements"""
-        if not self.browser_config:
-            raise RuntimeError("Browser not initialized")
-            
+        driver = self.browser_config.driver
         wait_time = timeout or self.browser_config.default_timeout
-        return WebDriverWait(self.browser_config.driver, wait_time).until(
-            EC.presence_of_all_elements_located(locator)
+        return self._WebDriverWait(driver, wait_time).until(
+            self._EC.presence_of_all_elements_located(locator)
         )
         
-    def wait_for_condition(self, condition, timeout: int = None):
+    def wait_for_condition(self, condition, timeout: int = None,
+                           poll_frequency: float = _CONDITION_POLL_INTERVAL):
         """Wait for specific condition"""
-        if not self.browser_config:
-            raise RuntimeError("Browser not initialized")
-            
+        driver = self.browser_config.driver
         wait_time = timeout or self.browser_config.default_timeout
-        return WebDriverWait(self.browser_config.driver, wait_time).until(condition)
+        return self._WebDriverWait(driver, wait_time,
+                                   poll_frequency=poll_frequency).until(condition)
         
     def get_current_url(self) -> str:
         """Get current browser URL"""
-        if not self.browser_config:
-            raise RuntimeError("Browser not initialized")
         return self.browser_config.driver.current_url
         
     def get_page_title(self) -> str:
         """Get current page title"""
-        if not self.browser_config:
-            raise RuntimeError("Browser not initialized")
         return self.browser_config.driver.title
 
 # ==================== COMMON TASKS ====================
@@ -167,7 +238,7 @@ class Open:
         
     def perform_as(self, actor: Actor):
         """Perform navigation task"""
-        browser = actor.uses_ability("browse_the_web")
+        browser = actor.browser
         browser.navigate_to(self.url)
         print(f"🎬 {actor.name} opens {self.url}")
 
@@ -180,7 +251,7 @@ class Click:
         
     def perform_as(self, actor: Actor):
         """Perform click task"""
-        browser = actor.uses_ability("browse_the_web")
+        browser = actor.browser
         element = browser.find_element(self.locator)
         element.click()
         print(f"🎬 {actor.name} clicks on {self.description}")
@@ -195,20 +266,82 @@ class Enter:
         
     def perform_as(self, actor: Actor):
         """Perform text entry task"""
-        browser = actor.uses_ability("browse_the_web")
+        browser = actor.browser
         element = browser.find_element(self.into)
         element.clear()
         element.send_keys(self.text)
         print(f"🎬 {actor.name} enters '{self.text}' into {self.description}")
 
+class TaskBatch:
+    """Task running a sequence of Enter/Click tasks in one WebDriver round-trip"""
+    
+    def __init__(self, *tasks):
+        self.tasks = tasks
+        self.steps = self._build_steps(tasks)
+        
+    def __iter__(self):
+        """Iterate the wrapped tasks, so actor.attempts_to(*batch) runs them one by one"""
+        return iter(self.tasks)
+        
+    @staticmethod
+    def _build_steps(tasks) -> Optional[List[list]]:
+        """Translate tasks into script steps, or None if any cannot be batched"""
+        steps = []
+        for task in tasks:
+            if type(task) is Click and task.locator[0] in _BATCHABLE_LOCATORS:
+                steps.append(["click", task.locator[0], task.locator[1], None])
+            elif type(task) is Enter and task.into[0] in _BATCHABLE_LOCATORS:
+                steps.append(["enter", task.into[0], task.into[1], task.text])
+            else:
+                return None
+        return steps
+        
+    def perform_as(self, actor: Actor):
+        """Perform all tasks in one script, falling back to one task at a time"""
+        if self.steps is not None:
+            from selenium.common.exceptions import JavascriptException
+            browser = actor.browser
+            try:
+                batched = browser.browser_config.driver.execute_script(_BATCH_SCRIPT, self.steps)
+            except JavascriptException:
+                batched = False
+            if batched:
+                for task in self.tasks:
+                    if type(task) is Enter:
+                        print(f"🎬 {actor.name} enters '{task.text}' into {task.description}")
+                    else:
+                        print(f"🎬 {actor.name} clicks on {task.description}")
+                return
+                
+        # Locators the script cannot resolve, or elements missing or not interactable
+        for task in self.tasks:
+            task.perform_as(actor)
+
 class Wait:
     """Task to wait for conditions"""
     
-    def __init__(self, seconds: int):
+    def __init__(self, seconds: int, condition: Optional[Callable] = None, description: str = ""):
+        self.mode = "condition" if condition is not None else "sleep"
         self.seconds = seconds
+        self.condition = condition
+        self.description = description or "condition"
+        if condition is None:
+            warnings.warn("Wait(seconds) sleeps unconditionally; prefer Wait.for_(condition)",
+                          DeprecationWarning, stacklevel=2)
+        
+    @classmethod
+    def for_(cls, condition: Callable, timeout: int = None, description: str = "") -> 'Wait':
+        """Create a wait that polls a Selenium condition instead of sleeping"""
+        return cls(timeout, condition, description)
         
     def perform_as(self, actor: Actor):
         """Perform wait task"""
+        if self.mode == "condition":
+            browser = actor.browser
+            browser.wait_for_condition(self.condition, self.seconds)
+            print(f"🎬 {actor.name} waits for {self.description}")
+            return
+            
         time.sleep(self.seconds)
         print(f"🎬 {actor.name} waits for {self.seconds} seconds")
 
@@ -224,7 +357,7 @@ class Text:
         
     def answered_by(self, actor: Actor) -> bool:
         """Answer the text verification question"""
-        browser = actor.uses_ability("browse_the_web")
+        browser = actor.browser
         element = browser.find_element(self.locator)
         actual_text = element.text.strip()
         
@@ -243,7 +376,7 @@ class Url:
         
     def answered_by(self, actor: Actor) -> bool:
         """Answer the URL verification question"""
-        browser = actor.uses_ability("browse_the_web")
+        browser = actor.browser
         current_url = browser.get_current_url()
         
         if self.contains:
@@ -264,7 +397,7 @@ class Title:
         
     def answered_by(self, actor: Actor) -> bool:
         """Answer the title verification question"""
-        browser = actor.uses_ability("browse_the_web")
+        browser = actor.browser
         current_title = browser.get_page_title()
         
         assert current_title == self.expected_title, \
@@ -275,22 +408,27 @@ class Title:
 
 # ==================== FLUENT INTERFACE BUILDERS ====================
 
+_LOGIN_CLICK_TASK = Click(_LOGIN_BUTTON_LOC, "login button")
+_LOGOUT_TASK = Click(_LOGOUT_LOC, "logout button")
+_DASHBOARD_TASK = Click(_DASHBOARD_LINK, "dashboard link")
+_PROFILE_TASK = Click(_PROFILE_LINK, "profile link")
+
 class AuthenticationTasks:
     """Fluent interface for authentication-related tasks"""
     
     @staticmethod
     def login_as(username: str, password: str):
-        """Create login task sequence"""
-        return [
-            Enter(username, (By.ID, "username"), "username field"),
-            Enter(password, (By.ID, "password"), "password field"),
-            Click((By.ID, "login-button"), "login button")
-        ]
+        """Create login task sequence, submitted as a single batch"""
+        return TaskBatch(
+            Enter(username, _USERNAME_LOC, "username field"),
+            Enter(password, _PASSWORD_LOC, "password field"),
+            _LOGIN_CLICK_TASK
+        )
         
     @staticmethod
     def logout():
         """Create logout task"""
-        return Click((By.ID, "logout-button"), "logout button")
+        return _LOGOUT_TASK
 
 class NavigationTasks:
     """Fluent interface for navigation tasks"""
@@ -298,12 +436,12 @@ class NavigationTasks:
     @staticmethod
     def to_dashboard():
         """Navigate to dashboard"""
-        return Click((By.LINK_TEXT, "Dashboard"), "dashboard link")
+        return _DASHBOARD_TASK
         
     @staticmethod
     def to_profile():
         """Navigate to profile"""
-        return Click((By.LINK_TEXT, "Profile"), "profile link")
+        return _PROFILE_TASK
 
 # ==================== PRACTICAL EXAMPLE IMPLEMENTATION ====================
 
@@ -340,7 +478,7 @@ def demonstrate_screenplay_pattern():
     # driver.find_element(By.ID, "login-button").click()
     
     # We write:
-    # user.attempts_to(*AuthenticationTasks.login_as("user", "pass"))
+    # user.attempts_to(AuthenticationTasks.login_as("user", "pass"))
     # user.should_see_the(Url("/dashboard"))
     
     print("\n✅ Screenplay Pattern advantages demonstrated:")
@@ -394,19 +532,19 @@ class EnterUsername(Task):
     def __init__(self, username):
         self.username = username
     def perform_as(self, actor):
-        browser = actor.uses_ability("browse_the_web")
+        browser = actor.browser
         browser.find_element((By.ID, "username")).send_keys(self.username)
 
 class EnterPassword(Task):
     def __init__(self, password):
         self.password = password
     def perform_as(self, actor):
-        browser = actor.uses_ability("browse_the_web")
+        browser = actor.browser
         browser.find_element((By.ID, "password")).send_keys(self.password)
 
 class ClickLogin(Task):
     def perform_as(self, actor):
-        browser = actor.uses_ability("browse_the_web")
+        browser = actor.browser
         browser.find_element((By.ID, "login-button")).click()
 
 # Fluent interface
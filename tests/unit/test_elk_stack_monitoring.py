@@ -0,0 +1,289 @@
+"""
+Unit tests for the ELK stack monitoring helpers
+Covers test result processing, bulk indexing and log ingestion
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, AsyncMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'monitoring'))
+
+try:
+    import elk_stack_monitoring as elk
+except ImportError:  # elasticsearch client not installed
+    elk = None
+
+
+@unittest.skipIf(elk is None, "ELK monitoring dependencies not installed")
+class TestTestResultEnrichment(unittest.TestCase):
+    """
+    Test enrichment of raw test results for indexing
+    """
+
+    def test_missing_fields_use_defaults(self):
+        """
+        Absent fields fall back to their defaults and a None status becomes unknown
+        """
+        enriched = elk._enrich_test_result({"status": None}, "2024-01-01T00:00:00")
+
+        self.assertEqual(enriched["@timestamp"], "2024-01-01T00:00:00")
+        self.assertEqual(enriched["test_name"], "unknown")
+        self.assertEqual(enriched["status"], "unknown")
+        self.assertEqual(enriched["duration"], 0)
+        self.assertEqual(enriched["suite"], "default")
+        self.assertEqual(enriched["tags"], ["test-result", "default"])
+        self.assertNotIn("error_details", enriched)
+
+    def test_failed_result_gets_error_details(self):
+        """
+        Failed results carry classified error details and a failure tag
+        """
+        enriched = elk._enrich_test_result({
+            "test_name": "login",
+            "status": "failed",
+            "suite": "auth",
+            "error": "Timeout waiting for element",
+            "performance": {"p95": 12}
+        }, "ts")
+
+        self.assertEqual(enriched["log_level"], "ERROR")
+        self.assertEqual(enriched["performance"], {"p95": 12})
+        self.assertEqual(enriched["error_details"]["message"], "Timeout waiting for element")
+        self.assertEqual(enriched["error_details"]["stack_trace"], "")
+        self.assertEqual(enriched["tags"], ["test-result", "auth", "failure"])
+
+
+@unittest.skipIf(elk is None, "ELK monitoring dependencies not installed")
+class TestSummarizeTestResults(unittest.TestCase):
+    """
+    Test the local columnar test summary
+    """
+
+    def test_summary_counts_consumed_results(self):
+        """
+        The summary reflects every processed result
+        """
+        processor = elk.LogPipelineProcessor()
+        processor.process_test_results([
+            {"status": "passed", "duration": 10},
+            {"status": "passed", "duration": 30},
+            {"status": "failed", "duration": 20, "error": "boom"},
+            {"status": "skipped", "duration": "n/a"}
+        ])
+
+        summary = processor.summarize_test_results()
+
+        self.assertEqual(summary["total_tests"], 4)
+        self.assertEqual(summary["passed_tests"], 2)
+        self.assertEqual(summary["failed_tests"], 1)
+        self.assertAlmostEqual(summary["avg_duration"], 15.0)
+        self.assertEqual(summary["max_duration"], 30.0)
+        self.assertEqual(summary["success_rate"], 50.0)
+
+    def test_empty_summary(self):
+        """
+        A processor without results reports zeros
+        """
+        summary = elk.LogPipelineProcessor().summarize_test_results()
+
+        self.assertEqual(summary["total_tests"], 0)
+        self.assertEqual(summary["success_rate"], 0)
+
+    def test_partially_consumed_and_interleaved_batches(self):
+        """
+        Only yielded results are counted, whatever order generators are consumed in
+        """
+        processor = elk.LogPipelineProcessor()
+        failing = processor.iter_test_results([{"status": "failed"}] * 3)
+        passing = processor.iter_test_results([{"status": "passed"}] * 2)
+
+        next(failing)
+        next(passing)
+        summary = processor.summarize_test_results()
+        self.assertEqual((summary["total_tests"], summary["passed_tests"]), (2, 1))
+
+        failing.close()
+        list(passing)
+        summary = processor.summarize_test_results()
+        self.assertEqual((summary["total_tests"], summary["passed_tests"], summary["failed_tests"]), (3, 2, 1))
+
+
+@unittest.skipIf(elk is None, "ELK monitoring dependencies not installed")
+class TestBulkActionStream(unittest.TestCase):
+    """
+    Test bulk action generation and document ids
+    """
+
+    RESULTS = [
+        {"test_name": "a", "status": "passed", "duration": 1},
+        {"test_name": "a", "status": "passed", "duration": 1},
+        {"test_name": "b", "status": "failed", "error": "assert"}
+    ]
+
+    def ids_for(self, timestamp, run_id=None):
+        with patch.object(elk, "datetime") as fake_datetime:
+            fake_datetime.now.return_value.isoformat.return_value = timestamp
+            documents = elk.LogPipelineProcessor().iter_test_results(self.RESULTS)
+            stream = elk._BulkActionStream("idx", documents, content_ids=True, run_id=run_id)
+            return [action["_id"] for action in stream]
+
+    def test_replayed_run_reuses_ids(self):
+        """
+        Re-submitting a run with its run id overwrites instead of duplicating
+        """
+        self.assertEqual(self.ids_for("2024-01-01T00:00:00", run_id="run-1"),
+                         self.ids_for("2024-06-01T12:00:00", run_id="run-1"))
+        self.assertEqual(self.ids_for("2024-01-01T00:00:00"), self.ids_for("2024-01-01T00:00:00"))
+
+    def test_identical_results_from_separate_runs_keep_history(self):
+        """
+        The same outcome in two runs is indexed twice, not overwritten
+        """
+        first_run = self.ids_for("2024-01-01T00:00:00")
+        second_run = self.ids_for("2024-01-02T00:00:00")
+        self.assertFalse(set(first_run) & set(second_run))
+
+        self.assertFalse(set(self.ids_for("ts", run_id="run-1")) & set(self.ids_for("ts", run_id="run-2")))
+
+    def test_identical_results_keep_distinct_ids(self):
+        """
+        Identical results in one batch are numbered instead of collapsing into one document
+        """
+        first, second, third = self.ids_for("ts")
+
+        self.assertEqual(second, f"{first}-1")
+        self.assertEqual(len({first, second, third}), 3)
+
+    def test_plain_stream_yields_encoded_sources(self):
+        """
+        Without content ids the stream yields pre-encoded sources and counts them
+        """
+        stream = elk._BulkActionStream("idx", [{"a": 1}, {"b": 2}])
+
+        actions = list(stream)
+
+        self.assertEqual(stream.count, 2)
+        self.assertTrue(all(isinstance(action, bytes) for action in actions))
+
+
+@unittest.skipIf(elk is None, "ELK monitoring dependencies not installed")
+class TestAsyncIndexing(unittest.TestCase):
+    """
+    Test how indexing runs on and off an event loop
+    """
+
+    def make_orchestrator(self):
+        orchestrator = elk.MonitoringOrchestrator()
+        orchestrator.data_indexer = MagicMock()
+        orchestrator.data_indexer.query_test_metrics.return_value = {"error": "offline"}
+        orchestrator.data_indexer.close_async = AsyncMock()
+        self.addCleanup(orchestrator.close)
+        return orchestrator
+
+    def test_repeated_calls_share_one_event_loop(self):
+        """
+        The async client stays bound to one loop across orchestrator calls
+        """
+        orchestrator = self.make_orchestrator()
+        loops = []
+
+        async def index(results, logs, run_id=None):
+            loops.append(asyncio.get_running_loop())
+            return {"total_count": len(list(results)), "success_rate": 100.0}, None
+
+        orchestrator.data_indexer.index_test_data_async = AsyncMock(side_effect=index)
+
+        with patch("builtins.print"):
+            orchestrator.process_and_index_test_data([{"status": "passed"}])
+            orchestrator.process_and_index_test_data([{"status": "passed"}])
+
+        self.assertEqual(len(loops), 2)
+        self.assertIs(loops[0], loops[1])
+
+    def test_running_loop_falls_back_to_sync_indexing(self):
+        """
+        Callers already inside an event loop get the synchronous bulk path
+        """
+        orchestrator = self.make_orchestrator()
+        orchestrator.data_indexer.index_test_results.return_value = {"total_count": 1, "success_rate": 100.0}
+
+        async def call_from_loop():
+            with patch("builtins.print"):
+                return orchestrator.process_and_index_test_data([{"status": "passed"}], ["INFO ready"])
+
+        asyncio.run(call_from_loop())
+
+        orchestrator.data_indexer.index_test_results.assert_called_once()
+        orchestrator.data_indexer.index_application_logs.assert_called_once()
+        orchestrator.data_indexer.index_test_data_async.assert_not_called()
+
+    def test_index_template_is_applied_off_the_loop(self):
+        """
+        The synchronous template call runs in a worker thread, not on the event loop
+        """
+        indexer = elk.ELKDataIndexer(es_client=MagicMock())
+        indexer._async_client = AsyncMock()
+        indexer._async_bulk_index = AsyncMock(return_value={"errors": []})
+        template_threads = []
+        indexer.es_client.indices.put_index_template.side_effect = (
+            lambda **kwargs: template_threads.append(threading.get_ident()))
+
+        asyncio.run(indexer.index_test_data_async([{"status": "passed"}]))
+
+        self.assertEqual(len(template_threads), 1)
+        self.assertNotEqual(template_threads[0], threading.get_ident())
+
+
+@unittest.skipIf(elk is None, "ELK monitoring dependencies not installed")
+class TestFileLogSource(unittest.TestCase):
+    """
+    Test log file ingestion
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.log_path = Path(self.tmp.name) / "app.log"
+        self.log_path.write_bytes(b"first line\r\n\nsecond line\nthird line without newline")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_lines_across_chunk_boundaries(self):
+        """
+        Lines split across read chunks are reassembled and blank lines skipped
+        """
+        lines = list(elk.FileLogSource(self.log_path, chunk_size=4))
+
+        self.assertEqual(lines, ["first line", "second line", "third line without newline"])
+
+    def test_string_path_is_read_as_a_file(self):
+        """
+        A plain string app_logs argument is streamed from disk, not iterated per character
+        """
+        orchestrator = elk.MonitoringOrchestrator()
+        consumed = {}
+
+        async def index(results, logs, run_id=None):
+            consumed["results"] = list(results)
+            consumed["logs"] = list(logs)
+            return {"total_count": len(consumed["results"]), "success_rate": 100.0}, {}
+
+        orchestrator.data_indexer = MagicMock()
+        orchestrator.data_indexer.index_test_data_async = AsyncMock(side_effect=index)
+        orchestrator.data_indexer.query_test_metrics.return_value = {"error": "offline"}
+        orchestrator.data_indexer.close_async = AsyncMock()
+        self.addCleanup(orchestrator.close)
+
+        with patch("builtins.print"):
+            orchestrator.process_and_index_test_data([{"status": "passed"}], str(self.log_path))
+
+        self.assertEqual(len(consumed["logs"]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
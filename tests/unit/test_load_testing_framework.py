@@ -0,0 +1,133 @@
+"""
+Unit tests for the k6 load testing framework helpers
+Covers k6 result ingestion into columnar samples and metric extraction
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import load_testing_framework as ltf
+except ImportError:  # numpy/Pillow not installed
+    ltf = None
+
+CSV_HEADER = ("metric_name,timestamp,metric_value,check,error,error_code,expected_response,"
+              "group,method,name,proto,scenario,service,status,subproto,tls_version,url,extra_tags\n")
+
+
+def csv_row(metric, value, scenario, status):
+    return (f"{metric},1700000000,{value},,,,true,,POST,/api/generate,HTTP/1.1,"
+            f"{scenario},,{status},,,http://localhost/api/generate,\n")
+
+
+def ndjson_point(value, scenario, status):
+    return json.dumps({
+        "type": "Point",
+        "metric": "http_req_duration",
+        "data": {"value": value, "tags": {"status": str(status), "scenario": scenario}}
+    }) + "\n"
+
+
+@unittest.skipIf(ltf is None, "load testing dependencies not installed")
+class TestResultIngestion(unittest.TestCase):
+    """
+    Test k6 result parsing into columnar samples
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.results_dir = Path(self.tmp.name)
+        self.tester = ltf.K6LoadTester(results_dir=str(self.results_dir))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_collect_samples_csv_keeps_only_request_durations(self):
+        """
+        Only http_req_duration rows become samples, with status and scenario columns
+        """
+        path = self.results_dir / "results.csv"
+        path.write_text(
+            CSV_HEADER
+            + csv_row("http_reqs", 1, "small", 200)
+            + csv_row("http_req_duration", 120.5, "small", 200)
+            + csv_row("http_req_duration", 300.0, "large", 500)
+            + csv_row("vus", 3, "", "")
+        )
+
+        samples = self.tester._collect_samples_csv(path)
+
+        self.assertEqual(samples['durations'].tolist(), [120.5, 300.0])
+        self.assertEqual(samples['statuses'].tolist(), [200, 500])
+        self.assertEqual(samples['scenarios'].tolist(), ["small", "large"])
+
+    def test_collect_samples_csv_empty_file(self):
+        """
+        An empty results file yields empty columns
+        """
+        path = self.results_dir / "results.csv"
+        path.write_text("")
+
+        samples = self.tester._collect_samples_csv(path)
+
+        self.assertEqual(samples['durations'].size, 0)
+        self.assertEqual(samples['scenarios'].size, 0)
+
+    def test_csv_and_ndjson_samples_match(self):
+        """
+        CSV and NDJSON outputs of the same run produce the same samples
+        """
+        points = [("small", 100.0, 200), ("large", 250.0, 200), ("large", 900.0, 503)]
+        csv_path = self.results_dir / "results.csv"
+        csv_path.write_text(CSV_HEADER + "".join(
+            csv_row("http_req_duration", value, scenario, status) for scenario, value, status in points
+        ))
+        json_path = self.results_dir / "results.json"
+        json_path.write_text("".join(ndjson_point(value, scenario, status) for scenario, value, status in points))
+
+        from_csv = self.tester._collect_samples_csv(csv_path)
+        from_json = self.tester._collect_samples(ltf._iter_ndjson(json_path))
+
+        for column in ('durations', 'statuses', 'scenarios'):
+            self.assertEqual(from_csv[column].tolist(), from_json[column].tolist())
+
+    def test_extract_metrics_per_scenario_group(self):
+        """
+        Metrics can be restricted to a subset of scenarios
+        """
+        path = self.results_dir / "results.json"
+        path.write_text(ndjson_point(100, "set0_res0", 200)
+                        + ndjson_point(200, "set0_res1", 500)
+                        + ndjson_point(1000, "set1_res0", 200))
+        samples = self.tester._collect_samples(ltf._iter_ndjson(path))
+
+        metrics = self.tester._extract_metrics(samples, {"set0_res0", "set0_res1"})
+
+        self.assertEqual(metrics['total_requests'], 2)
+        self.assertEqual(metrics['successful_requests'], 1)
+        self.assertAlmostEqual(metrics['error_rate'], 0.5)
+        self.assertAlmostEqual(metrics['avg_response_time'], 150.0)
+        self.assertEqual(self.tester._extract_metrics(samples, {"missing"}),
+                         {'error': 'No HTTP metrics found'})
+
+    def test_process_results_names_chart_with_run_timestamp(self):
+        """
+        The performance chart shares the run's timestamp with the other artifacts
+        """
+        path = self.results_dir / "results_20240101_120000.csv"
+        path.write_text(CSV_HEADER + csv_row("http_req_duration", 100, "small_basic", 200))
+
+        result = self.tester._process_test_results(path, 1.0, self.tester.default_scenarios,
+                                                   timestamp="20240101_120000")
+
+        self.assertTrue(result['success'], result.get('error'))
+        self.assertTrue((self.results_dir / "performance_chart_20240101_120000.png").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+"""
+Unit tests for the observability-driven testing framework
+Covers metric collection, alerting and suite results
+"""
+import io
+import json
+import os
+import sys
+import time
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'observability'))
+
+try:
+    import prometheus_observability as obs
+except ImportError:  # prometheus_client/numpy not installed
+    obs = None
+
+
+def make_config():
+    return obs.TestObservabilityConfig(
+        prometheus_url="http://localhost:9090",
+        grafana_url="http://localhost:3000",
+        alertmanager_url="http://localhost:9093"
+    )
+
+
+def make_result(status="passed", duration_ms=100.0, cpu=10.0, memory=1000.0):
+    return obs.ObservableTestResult(
+        test_name="api_test",
+        status=status,
+        duration_ms=duration_ms,
+        timestamp="2024-01-01T00:00:00",
+        system_metrics={"cpu_percent": cpu, "memory_mb": memory},
+        correlation_id="id",
+        environment="testing",
+        resource_utilization={}
+    )
+
+
+@unittest.skipIf(obs is None, "observability dependencies not installed")
+class TestMetricSamples(unittest.TestCase):
+    """
+    Test the typed column sample buffer
+    """
+
+    def test_mean_peak_and_rows(self):
+        """
+        Samples are stored per column and can be read back as rows
+        """
+        samples = obs.MetricSamples("api_test", max_samples=10)
+        samples.append(1, (10.0, 100.0, 0, 0, 0.5, 50))
+        samples.append(2, (30.0, 300.0, 0, 0, 1.5, 52))
+
+        self.assertEqual(len(samples), 2)
+        self.assertEqual(samples.mean("cpu_percent"), 20.0)
+        self.assertEqual(samples.peak("memory_mb"), 300.0)
+        self.assertEqual(samples.to_dicts()[1]["timestamp"], 2)
+        self.assertEqual(samples.to_dicts()[0]["test_name"], "api_test")
+
+    def test_full_buffer_drops_oldest_half(self):
+        """
+        A full buffer keeps the most recent window
+        """
+        samples = obs.MetricSamples("api_test", max_samples=4)
+        for i in range(5):
+            samples.append(i, (float(i),) * len(obs._SAMPLE_COLUMNS))
+
+        self.assertEqual(list(samples.timestamps), [2, 3, 4])
+        self.assertEqual(list(samples.columns["cpu_percent"]), [2.0, 3.0, 4.0])
+
+
+@unittest.skipIf(obs is None, "observability dependencies not installed")
+class TestSystemMetricsCollector(unittest.TestCase):
+    """
+    Test per-second rates from cumulative counters
+    """
+
+    def test_counter_rate(self):
+        """
+        Cumulative counters report bytes per second, starting from a zero baseline
+        """
+        collector = obs.SystemMetricsCollector(make_config())
+
+        self.assertEqual(collector._counter_rate("test_counter", 100), 0)
+        collector._last_counters["test_counter"] = (100, time.monotonic() - 2.0)
+        self.assertAlmostEqual(collector._counter_rate("test_counter", 300), 100.0, delta=5.0)
+        self.assertEqual(collector._counter_rate("test_counter", 10), 0)
+
+    def test_sampling_start_resets_counter_baseline(self):
+        """
+        The idle gap before a test is not folded into its first sample
+        """
+        collector = obs.SystemMetricsCollector(make_config())
+        collector._counter_rate("disk_io", 100)
+
+        with patch.object(collector, "_sample_loop"):
+            collector.start("api_test")
+            collector.stop()
+
+        self.assertEqual(collector._last_counters, {})
+
+
+@unittest.skipIf(obs is None, "observability dependencies not installed")
+class TestAlertEvaluation(unittest.TestCase):
+    """
+    Test alert thresholds and bookkeeping
+    """
+
+    def test_thresholds_trigger_batched_alerts(self):
+        """
+        Slow, resource-heavy failures raise every matching alert in one batch
+        """
+        manager = obs.ObservabilityAlertManager("http://localhost:9093")
+
+        with patch("builtins.print") as fake_print:
+            alerts = manager.evaluate_test_alerts(
+                make_result("failed", duration_ms=obs._TIMEOUT_MS + 1, cpu=95.0, memory=9000.0))
+
+        self.assertEqual([alert["alertname"] for alert in alerts], [
+            "TestPerformanceDegradation", "TestResourceExhaustion",
+            "TestResourceExhaustion", "TestFailureSystemCorrelation"
+        ])
+        self.assertEqual(fake_print.call_count, 1)
+        self.assertEqual(manager.alerts_triggered, 4)
+        self.assertEqual(len(manager.drain_alerts()), 4)
+        self.assertEqual(manager.drain_alerts(), [])
+
+    def test_healthy_result_has_no_alerts(self):
+        """
+        Results within thresholds raise nothing
+        """
+        manager = obs.ObservabilityAlertManager("http://localhost:9093")
+
+        self.assertEqual(manager.evaluate_test_alerts(make_result()), [])
+        self.assertEqual(manager.alerts_triggered, 0)
+
+
+@unittest.skipIf(obs is None, "observability dependencies not installed")
+class TestBackgroundAggregation(unittest.TestCase):
+    """
+    Test that suite summaries agree with the suite's own results
+    """
+
+    TEST_CASES = [
+        {"name": "first", "simulated_duration": 10, "success_probability": 1.0},
+        {"name": "second", "simulated_duration": 10, "success_probability": 1.0}
+    ]
+
+    def setUp(self):
+        self.orchestrator = obs.ObservabilityTestingOrchestrator(make_config())
+        self.addCleanup(self.orchestrator.stop_background_aggregator)
+
+    def run_suite(self, test_cases):
+        # Redirect rather than patch print: numba registers builtins on first import
+        with redirect_stdout(io.StringIO()):
+            return self.orchestrator.run_observability_driven_test_suite(test_cases)
+
+    def test_stale_snapshot_is_not_served(self):
+        """
+        A snapshot covering fewer results than the suite ran is ignored
+        """
+        self.orchestrator.start_background_aggregator(interval=3600)
+        self.run_suite(self.TEST_CASES[:1])
+        self.orchestrator._refresh_snapshot()
+
+        results = self.run_suite(self.TEST_CASES)
+
+        self.assertEqual(results["summary"]["total_tests"], len(results["test_results"]))
+
+    def test_matching_snapshot_is_served(self):
+        """
+        A snapshot of exactly this suite's results is reused instead of re-aggregating
+        """
+        self.orchestrator.start_background_aggregator(interval=3600)
+        real_refresh = self.orchestrator.correlation_analyzer.analyze_correlations
+
+        def record_and_refresh(result):
+            # Refresh the snapshot right after the last result is recorded
+            self.orchestrator.test_results.append(result)
+            if len(self.orchestrator.test_results) == len(self.TEST_CASES):
+                self.orchestrator._refresh_snapshot()
+
+        with patch.object(self.orchestrator, "test_results", new=_RecordingList(record_and_refresh)):
+            with patch.object(self.orchestrator.correlation_analyzer, "analyze_correlations",
+                              wraps=real_refresh) as analyze:
+                results = self.run_suite(self.TEST_CASES)
+
+        self.assertEqual(analyze.call_count, 1)
+        self.assertEqual(results["summary"]["total_tests"], 2)
+        self.assertIn("suite_duration", results["summary"])
+        self.assertNotIn("suite_duration", self.orchestrator.latest_snapshot()["summary"])
+
+    def test_stop_refreshes_final_snapshot(self):
+        """
+        Stopping the aggregator leaves a snapshot of every recorded result
+        """
+        self.orchestrator.start_background_aggregator(interval=3600)
+        self.run_suite(self.TEST_CASES)
+
+        self.orchestrator.stop_background_aggregator()
+
+        self.assertEqual(self.orchestrator.latest_snapshot()["test_count"], 2)
+
+
+@unittest.skipIf(obs is None, "observability dependencies not installed")
+class TestSuiteResults(unittest.TestCase):
+    """
+    Test the shape of suite results handed to callers
+    """
+
+    def test_results_are_json_serializable(self):
+        """
+        The Prometheus exposition is decoded so results can be dumped as JSON
+        """
+        orchestrator = obs.ObservabilityTestingOrchestrator(make_config())
+        test_case = {"name": "only", "simulated_duration": 10, "success_probability": 1.0}
+
+        with redirect_stdout(io.StringIO()):
+            results = orchestrator.run_observability_driven_test_suite([test_case])
+
+        self.assertIsInstance(results["prometheus_metrics"], str)
+        self.assertIn("test_executions_total", json.dumps(results))
+
+
+class _RecordingList(list):
+    """List whose append is routed through a hook, to refresh snapshots mid-suite"""
+
+    def __init__(self, hook):
+        super().__init__()
+        self._hook = hook
+        self._appending = False
+
+    def append(self, item):
+        if self._appending:
+            return super().append(item)
+        self._appending = True
+        try:
+            self._hook(item)
+        finally:
+            self._appending = False
+
+
+if __name__ == "__main__":
+    unittest.main()
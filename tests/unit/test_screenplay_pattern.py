@@ -0,0 +1,189 @@
+"""
+Unit tests for the Screenplay pattern implementation
+Covers browser abilities, login tasks and waits
+"""
+import copy
+import os
+import pickle
+import sys
+import unittest
+import warnings
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'patterns'))
+
+try:
+    import screenplay_pattern as sp
+except ImportError:  # selenium not installed
+    sp = None
+
+
+def make_actor():
+    driver = MagicMock()
+    browser = sp.BrowseTheWeb()
+    browser.initialize(driver, "http://app.local")
+    return sp.Actor("Tester").can("browse_the_web", browser), driver
+
+
+@unittest.skipIf(sp is None, "selenium not installed")
+class TestUninitializedBrowser(unittest.TestCase):
+    """
+    Test the BrowseTheWeb sentinel used before initialize()
+    """
+
+    def test_methods_raise_runtime_error(self):
+        """
+        Every browser operation fails clearly before initialization
+        """
+        browser = sp.BrowseTheWeb()
+        calls = [
+            lambda: browser.navigate_to("/login"),
+            lambda: browser.find_element(("id", "username"), timeout=1),
+            lambda: browser.find_elements(("id", "username")),
+            lambda: browser.wait_for_condition(lambda driver: True, 1),
+            browser.get_current_url,
+            browser.get_page_title
+        ]
+        for call in calls:
+            with self.assertRaisesRegex(RuntimeError, "Browser not initialized"):
+                call()
+
+    def test_copy_pickle_and_probes(self):
+        """
+        Dunder lookups behave like missing attributes so copy, pickle and hasattr work
+        """
+        browser = sp.BrowseTheWeb()
+
+        self.assertFalse(hasattr(browser.browser_config, "__len__"))
+        pickle.loads(pickle.dumps(browser))
+        clone = copy.deepcopy(browser)
+        with self.assertRaisesRegex(RuntimeError, "Browser not initialized"):
+            clone.get_current_url()
+
+    def test_initialize_replaces_sentinel(self):
+        """
+        After initialize() the browser talks to the driver
+        """
+        actor, driver = make_actor()
+        driver.current_url = "http://app.local/dashboard"
+
+        self.assertEqual(actor.browser.get_current_url(), "http://app.local/dashboard")
+
+
+@unittest.skipIf(sp is None, "selenium not installed")
+class TestTaskBatch(unittest.TestCase):
+    """
+    Test batched execution of Enter/Click tasks
+    """
+
+    def test_login_runs_as_single_script(self):
+        """
+        login_as submits all three steps in one execute_script call
+        """
+        actor, driver = make_actor()
+        driver.execute_script.return_value = True
+
+        with patch("builtins.print"):
+            actor.attempts_to(sp.AuthenticationTasks.login_as("user", "secret"))
+
+        driver.execute_script.assert_called_once()
+        script, steps = driver.execute_script.call_args.args
+        self.assertIn("dispatchEvent(new Event('input'", script)
+        self.assertEqual(steps, [
+            ["enter", "id", "username", "user"],
+            ["enter", "id", "password", "secret"],
+            ["click", "id", "login-button", None]
+        ])
+        driver.find_element.assert_not_called()
+
+    def test_falls_back_to_individual_tasks(self):
+        """
+        When the script cannot find every element, each task runs on its own
+        """
+        actor, driver = make_actor()
+        driver.execute_script.return_value = False
+
+        with patch("builtins.print"):
+            actor.attempts_to(sp.AuthenticationTasks.login_as("user", "secret"))
+
+        element = driver.find_element.return_value
+        element.send_keys.assert_any_call("user")
+        element.send_keys.assert_any_call("secret")
+        element.click.assert_called_once()
+
+    def test_script_error_falls_back_to_individual_tasks(self):
+        """
+        A script that throws (e.g. no value setter on a custom element) takes the per-task path
+        """
+        from selenium.common.exceptions import JavascriptException
+        actor, driver = make_actor()
+        driver.execute_script.side_effect = JavascriptException("setter is undefined")
+
+        with patch("builtins.print"):
+            actor.attempts_to(sp.AuthenticationTasks.login_as("user", "secret"))
+
+        element = driver.find_element.return_value
+        element.send_keys.assert_any_call("secret")
+        element.click.assert_called_once()
+
+    def test_unbatchable_locators_skip_the_script(self):
+        """
+        Locators the script cannot resolve (link text) are never batched
+        """
+        batch = sp.TaskBatch(sp.Click(("link text", "Dashboard")))
+
+        self.assertIsNone(batch.steps)
+
+    def test_batch_is_iterable_for_star_unpacking(self):
+        """
+        Existing attempts_to(*login_as(...)) callers keep working
+        """
+        actor, driver = make_actor()
+
+        tasks = list(sp.AuthenticationTasks.login_as("user", "secret"))
+        with patch("builtins.print"):
+            actor.attempts_to(*sp.AuthenticationTasks.login_as("user", "secret"))
+
+        self.assertEqual([type(task) for task in tasks], [sp.Enter, sp.Enter, sp.Click])
+        driver.execute_script.assert_not_called()
+
+
+@unittest.skipIf(sp is None, "selenium not installed")
+class TestWait(unittest.TestCase):
+    """
+    Test sleep and condition based waits
+    """
+
+    def test_sleep_wait_warns_at_construction(self):
+        """
+        Wait(seconds) is deprecated and the warning points at the caller
+        """
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            sp.Wait(0)
+
+        self.assertEqual(len(caught), 1)
+        self.assertIs(caught[0].category, DeprecationWarning)
+        self.assertEqual(caught[0].filename, __file__)
+
+    def test_condition_wait_polls_until_true(self):
+        """
+        Wait.for_ polls the condition instead of sleeping
+        """
+        actor, driver = make_actor()
+        polls = []
+
+        def ready(_driver):
+            polls.append(1)
+            return len(polls) >= 2
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            with patch("builtins.print"):
+                actor.attempts_to(sp.Wait.for_(ready, timeout=2, description="page ready"))
+
+        self.assertEqual(len(polls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()